@@ -1,4 +1,8 @@
 import logging
+import os
+import re
+import time
+from collections import OrderedDict
 
 from dotenv import load_dotenv
 from livekit.agents import (
@@ -7,9 +11,11 @@ from livekit.agents import (
     JobContext,
     JobProcess,
     MetricsCollectedEvent,
+    ModelSettings,
     RoomInputOptions,
     WorkerOptions,
     cli,
+    llm,
     metrics,
 )
 from livekit.plugins import noise_cancellation, silero
@@ -19,16 +25,122 @@ logger = logging.getLogger("agent")
 
 load_dotenv(".env.local")
 
+# LLM served through LiveKit inference. The small 8B model keeps voice replies
+# fast; point AGENT_LLM_MODEL at a larger or quantized endpoint to trade
+# latency for quality without touching code.
+LLM_MODEL = os.getenv("AGENT_LLM_MODEL", "cerebras/llama3.1-8b")
+
+
+# The system prompt is built once per worker process and sent byte-for-byte
+# identically on every session, so the LLM provider's prefix cache can reuse
+# the already-prefilled instructions instead of recomputing them per call.
+ASSISTANT_INSTRUCTIONS = (
+    "You are a helpful voice AI assistant; the user speaks to you by voice. "
+    "Answer concisely from your knowledge. "
+    "Use plain sentences with no formatting, emojis, asterisks or other symbols. "
+    "Be curious, friendly and a little humorous."
+)
+
+
+_NON_WORD_RE = re.compile(r"[^\w\s]+")
+
+# (model, instructions, normalized first user utterance)
+CacheKey = tuple[str, str, str]
+
+
+class ResponseCache:
+    """
+    Process-wide LRU of replies to opening questions, shared by all sessions.
+
+    Callers tend to open with the same handful of questions, so the reply to a
+    conversation's first user turn is cached under the normalized utterance,
+    together with the agent instructions and model that produced it, and
+    replayed without an LLM round-trip. Entries expire after `ttl` seconds so
+    answers to time-sensitive questions ("what's the latest on X") go stale
+    quickly. Later turns depend on the conversation history and are never
+    cached.
+    """
+
+    def __init__(self, max_size: int = 256, ttl: float = 300.0) -> None:
+        # key -> (expires_at, reply)
+        self._entries: OrderedDict[CacheKey, tuple[float, str]] = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+
+    @staticmethod
+    def key_for(
+        chat_ctx: llm.ChatContext, instructions: str, model: str
+    ) -> CacheKey | None:
+        messages = [
+            item
+            for item in chat_ctx.items
+            if isinstance(item, llm.ChatMessage) and item.role in ("user", "assistant")
+        ]
+        if len(messages) != 1 or messages[0].role != "user":
+            return None
+
+        text = _NON_WORD_RE.sub(" ", (messages[0].text_content or "").lower())
+        text = " ".join(text.split())
+        return (model, instructions, text) if text else None
+
+    def get(self, key: CacheKey) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, reply = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return reply
+
+    def put(self, key: CacheKey, reply: str) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, reply)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+_response_cache = ResponseCache()
+
 
 class Assistant(Agent):
     def __init__(self) -> None:
         super().__init__(
-            instructions="""You are a helpful voice AI assistant. The user is interacting with you via voice, even if you perceive the conversation as text.
-            You eagerly assist users with their questions by providing information from your extensive knowledge.
-            Your responses are concise, to the point, and without any complex formatting or punctuation including emojis, asterisks, or other symbols.
-            You are curious, friendly, and have a sense of humor.""",
+            instructions=ASSISTANT_INSTRUCTIONS,
         )
 
+    async def llm_node(
+        self,
+        chat_ctx: llm.ChatContext,
+        tools: list[llm.FunctionTool],
+        model_settings: ModelSettings,
+    ):
+        key = _response_cache.key_for(chat_ctx, self.instructions, LLM_MODEL)
+        cached = _response_cache.get(key) if key else None
+        if cached is not None:
+            logger.debug("Serving cached reply for %r", key[2])
+            yield cached
+            return
+
+        parts: list[str] = []
+        cacheable = key is not None
+        async for chunk in Agent.default.llm_node(
+            self, chat_ctx, tools, model_settings
+        ):
+            if isinstance(chunk, str):
+                parts.append(chunk)
+            elif isinstance(chunk, llm.ChatChunk) and chunk.delta:
+                if chunk.delta.tool_calls:
+                    cacheable = False
+                if chunk.delta.content:
+                    parts.append(chunk.delta.content)
+            yield chunk
+
+        # Only reached when generation ran to completion (not interrupted)
+        if cacheable and parts:
+            _response_cache.put(key, "".join(parts))
+
     # To add tools, use the @function_tool decorator.
     # Here's an example that adds a simple weather tool.
     # You also have to add `from livekit.agents.llm import function_tool, RunContext` to the top of this file
@@ -65,7 +177,7 @@ async def entrypoint(ctx: JobContext):
         stt="assemblyai/universal-streaming:en",
         # A Large Language Model (LLM) is your agent's brain, processing user input and generating a response
         # Using Cerebras for ultra-fast responses! See https://docs.livekit.io/agents/models/llm/plugins/cerebras
-        llm="cerebras/llama3.1-8b",  # Changed from llama-3.3-70b to llama3.1-8b
+        llm=LLM_MODEL,
         # Text-to-speech (TTS) is your agent's voice, turning the LLM's text into speech that the user can hear
         # See all available models as well as voice selections at https://docs.livekit.io/agents/models/tts/
         tts="cartesia/sonic-2:9626c31c-bec5-4cca-baa8-f8ba9e84c8bc",
@@ -99,7 +211,7 @@ async def entrypoint(ctx: JobContext):
 
     async def log_usage():
         summary = usage_collector.get_summary()
-        logger.info(f"Usage: {summary}")
+        logger.info("Usage: %s", summary)
 
     ctx.add_shutdown_callback(log_usage)
 
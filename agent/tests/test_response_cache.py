@@ -0,0 +1,77 @@
+import pytest
+from livekit.agents import Agent, ModelSettings, llm
+
+import agent
+from agent import Assistant, ResponseCache
+
+
+def _chat(*turns: tuple[str, str]) -> llm.ChatContext:
+    chat_ctx = llm.ChatContext.empty()
+    for role, text in turns:
+        chat_ctx.add_message(role=role, content=text)
+    return chat_ctx
+
+
+def test_key_normalizes_first_user_turn() -> None:
+    a = ResponseCache.key_for(_chat(("user", "What do you do?")), "inst", "m")
+    b = ResponseCache.key_for(_chat(("user", "  what   do you DO ")), "inst", "m")
+    assert a == b == ("m", "inst", "what do you do")
+
+
+def test_key_includes_instructions_and_model() -> None:
+    chat_ctx = _chat(("user", "Hello"))
+    key = ResponseCache.key_for(chat_ctx, "inst", "m")
+    assert key != ResponseCache.key_for(chat_ctx, "other", "m")
+    assert key != ResponseCache.key_for(chat_ctx, "inst", "other")
+
+
+def test_key_skips_later_turns_and_empty_text() -> None:
+    later = _chat(("user", "Hello"), ("assistant", "Hi!"), ("user", "Hello"))
+    assert ResponseCache.key_for(later, "inst", "m") is None
+    assert ResponseCache.key_for(_chat(("user", "?!")), "inst", "m") is None
+
+
+def test_entries_expire(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(agent.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(ttl=10)
+    key = ("m", "inst", "hello")
+
+    cache.put(key, "Hi there")
+    assert cache.get(key) == "Hi there"
+
+    now[0] += 10
+    assert cache.get(key) is None
+
+
+def test_evicts_least_recently_used() -> None:
+    cache = ResponseCache(max_size=2)
+    cache.put(("m", "i", "a"), "A")
+    cache.put(("m", "i", "b"), "B")
+    cache.get(("m", "i", "a"))
+    cache.put(("m", "i", "c"), "C")
+
+    assert cache.get(("m", "i", "b")) is None
+    assert cache.get(("m", "i", "a")) == "A"
+
+
+@pytest.mark.asyncio
+async def test_first_turn_reply_is_replayed(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(agent, "_response_cache", ResponseCache())
+    calls = []
+
+    async def fake_llm_node(self, chat_ctx, tools, model_settings):
+        calls.append(chat_ctx)
+        yield "Hello! "
+        yield "How can I help?"
+
+    monkeypatch.setattr(Agent.default, "llm_node", fake_llm_node)
+    assistant = Assistant()
+
+    async def reply() -> list:
+        chat_ctx = _chat(("user", "Hello"))
+        return [c async for c in assistant.llm_node(chat_ctx, [], ModelSettings())]
+
+    assert await reply() == ["Hello! ", "How can I help?"]
+    assert await reply() == ["Hello! How can I help?"]
+    assert len(calls) == 1
@@ -1,12 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
-from datetime import datetime
-from core.auth import AppwriteUser, get_current_user
-from core.config import get_settings
-from schemas.responses import SuccessResponse, ResponseMeta
+import logging
+from fastapi import APIRouter, Depends
+from core.auth import get_current_user
+from schemas.responses import ORJSONResponse, response_meta_json
+from utils.timestamps import utc_now_iso
 
 router = APIRouter(prefix="/v1/auth", tags=["authentication"])
-settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 @router.get("/me")
@@ -17,11 +16,9 @@ async def get_current_user_info(current_user: dict = Depends(get_current_user)):
     
     This endpoint demonstrates that only authenticated users can access protected routes.
     """
-    import logging
-    logger = logging.getLogger(__name__)
     logger.info(f"User authenticated: {current_user['email']} (ID: {current_user['$id']})")
     
-    return {
+    return ORJSONResponse({
         "data": {
             "user_id": current_user["$id"],
             "email": current_user["email"],
@@ -30,13 +27,9 @@ async def get_current_user_info(current_user: dict = Depends(get_current_user)):
             "labels": current_user["labels"],
             "created_at": current_user["registration"],
         },
-        "meta": {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "service": settings.service_name,
-            "version": settings.service_version,
-        },
+        "meta": response_meta_json(),
         "message": f"Authenticated as {current_user['email']}"
-    }
+    })
 
 
 @router.get("/test-connection")
@@ -45,16 +38,12 @@ async def test_backend_connection():
     Public test route to verify backend is accessible.
     No authentication required - this is in skip_paths.
     """
-    return {
+    return ORJSONResponse({
         "data": {
             "backend_status": "connected",
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": utc_now_iso(),
             "auth_required": False,
         },
-        "meta": {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "service": settings.service_name,
-            "version": settings.service_version,
-        },
+        "meta": response_meta_json(),
         "message": "Backend connection successful"
-    }
\ No newline at end of file
+    })
\ No newline at end of file
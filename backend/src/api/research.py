@@ -1,23 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, BackgroundTasks
-from fastapi.responses import JSONResponse
-from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Request, BackgroundTasks, Response
+from datetime import timedelta
 from typing import Optional
-from pydantic import BaseModel
+import hashlib
+from pydantic import BaseModel, ConfigDict
+import orjson
 
 from core.auth import AppwriteUser, get_current_user
 from core.config import get_settings
-from schemas.responses import SuccessResponse, ResponseMeta
+from schemas.responses import ORJSONResponse, SuccessResponse, ResponseMeta, response_meta_json
+from services.appwrite_service import appwrite_service, research_job_loader
 from workers.research_worker import execute_research_worker
 from utils.rate_limiting import check_research_rate_limit
+from utils.timestamps import utc_iso_after, utc_now_iso
 import logging
 
 router = APIRouter(prefix="/v1/research", tags=["research"])
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Research jobs typically complete within 10-15 minutes
+ESTIMATED_COMPLETION_DELTA = timedelta(minutes=12)
+
+# Finished jobs never change again, so clients may reuse their status briefly
+# and revalidate with If-None-Match afterwards
+TERMINAL_STATUSES = frozenset({"completed", "failed"})
+TERMINAL_CACHE_CONTROL = "private, max-age=60"
+
 
 class ResearchExecuteResponse(BaseModel):
     """Response model for research execution endpoint."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     job_id: str
     status: str
     message: str
@@ -26,6 +39,8 @@ class ResearchExecuteResponse(BaseModel):
 
 class ResearchStatusResponse(BaseModel):
     """Response model for research status endpoint."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     job_id: str
     status: str
     progress: Optional[str] = None
@@ -69,11 +84,8 @@ async def execute_research_job(
         # Step 0: Check rate limit
         check_research_rate_limit(current_user["$id"], "execution")
         
-        # Import Appwrite service
-        from services.appwrite_service import appwrite_service
-        
         # Step 1: Validate job exists and belongs to user
-        job = await appwrite_service.get_research_job(job_id)
+        job = await research_job_loader.load(job_id)
         if not job:
             raise HTTPException(status_code=404, detail="Research job not found")
         
@@ -89,34 +101,29 @@ async def execute_research_job(
         
         # Step 3: Update job status to "processing"
         await appwrite_service.update_job_status(job_id, "processing")
+        research_job_loader.clear(job_id)
         
         # Step 4: Queue background research task
         background_tasks.add_task(execute_research_worker, job_id)
         
         # Step 5: Calculate estimated completion (10-15 minutes from now)
-        estimated_completion = datetime.utcnow().replace(microsecond=0)
-        estimated_completion = estimated_completion + timedelta(minutes=12)
-        estimated_completion_str = estimated_completion.isoformat() + "Z"
+        estimated_completion_str = utc_iso_after(ESTIMATED_COMPLETION_DELTA)
         
         logger.info(f"Research job {job_id} queued for execution by user {current_user['$id']}")
         
-        # Simulate the response for now
-        response_data = ResearchExecuteResponse(
+        # Every field is a server-built string, so skip validation
+        response_data = ResearchExecuteResponse.model_construct(
             job_id=job_id,
             status="processing",
             message="Research job has been queued for execution",
             estimated_completion=estimated_completion_str
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=202,  # 202 Accepted for async processing
             content={
-                "data": response_data.model_dump(),
-                "meta": {
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                    "service": settings.service_name,
-                    "version": settings.service_version,
-                },
+                "data": orjson.Fragment(response_data.model_dump_json()),
+                "meta": response_meta_json(),
                 "message": "Research execution started successfully"
             }
         )
@@ -125,28 +132,29 @@ async def execute_research_job(
         # Re-raise HTTP exceptions as-is
         raise
     except Exception as e:
-        logger.error(f"Unexpected error executing research job {job_id}: {str(e)}")
-        logger.error(f"Error type: {type(e).__name__}")
-        logger.error(f"Error details: {repr(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Research execution failed: {str(e)}"
-        )
+        # Raised rather than left to the app-level handler so the 500 passes
+        # back out through the CORS and security header middleware
+        logger.exception(f"Unexpected error executing research job {job_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Research execution failed")
 
 
 @router.get("/status/{job_id}", response_model=SuccessResponse)
 async def get_research_status(
     job_id: str,
+    request: Request,
     current_user: dict = Depends(get_current_user)
 ):
     """
     Get the current status of a research job.
     
     This endpoint provides real-time status information about a research job,
-    including progress updates and error messages if applicable.
+    including progress updates and error messages if applicable. Completed and
+    failed jobs are returned with an ETag and Cache-Control header, and a
+    matching If-None-Match yields 304 Not Modified.
     
     Args:
         job_id: The unique identifier for the research job
+        request: Incoming request, for conditional headers
         user: Authenticated user from middleware
     
     Returns:
@@ -162,11 +170,8 @@ async def get_research_status(
         # Step 0: Check rate limit
         check_research_rate_limit(current_user["$id"], "status")
         
-        # Import Appwrite service
-        from services.appwrite_service import appwrite_service
-        
         # Step 1: Fetch job from Appwrite
-        job = await appwrite_service.get_research_job(job_id)
+        job = await research_job_loader.load(job_id)
         if not job:
             raise HTTPException(status_code=404, detail="Research job not found")
         
@@ -174,36 +179,38 @@ async def get_research_status(
             raise HTTPException(status_code=404, detail="Research job not found")
         
         # Build response data from actual job
+        now_iso = utc_now_iso()
         response_data = ResearchStatusResponse(
             job_id=job_id,
             status=job.get('status', 'pending'),
             progress=None,  # Could add progress tracking later
             error_message=job.get('error_message'),
-            created_at=job.get('created_at', datetime.utcnow().isoformat() + "Z"),
-            updated_at=job.get('updated_at', job.get('created_at', datetime.utcnow().isoformat() + "Z"))
+            created_at=job.get('created_at', now_iso),
+            updated_at=job.get('updated_at', job.get('created_at', now_iso))
         )
         
         logger.info(f"Status retrieved for job {job_id}: {response_data.status}")
         
-        return {
-            "data": response_data.model_dump(),
-            "meta": {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "service": settings.service_name,
-                "version": settings.service_version,
-            },
+        data_json = response_data.model_dump_json()
+        headers = None
+        if response_data.status in TERMINAL_STATUSES:
+            etag = f'"{hashlib.blake2b(data_json.encode(), digest_size=16).hexdigest()}"'
+            headers = {"ETag": etag, "Cache-Control": TERMINAL_CACHE_CONTROL}
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
+        
+        return ORJSONResponse({
+            "data": orjson.Fragment(data_json),
+            "meta": response_meta_json(),
             "message": f"Status retrieved successfully for job {job_id}"
-        }
+        }, headers=headers)
         
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
     except Exception as e:
-        logger.error(f"Unexpected error getting status for job {job_id}: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail="An unexpected error occurred while retrieving job status"
-        )
+        logger.exception(f"Unexpected error getting status for job {job_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve research status")
 
 
 @router.get("/health", include_in_schema=False)
@@ -212,10 +219,10 @@ async def research_health_check():
     Health check endpoint for the research service.
     Used for monitoring and debugging.
     """
-    return {
+    return ORJSONResponse({
         "service": "research",
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_now_iso(),
         "features": {
             "job_execution": True,
             "status_checking": True,
@@ -223,4 +230,4 @@ async def research_health_check():
             "appwrite_integration": False,  # Will be True in Phase 4.3
             "research_agents": False        # Will be True in Phase 5
         }
-    }
\ No newline at end of file
+    })
\ No newline at end of file
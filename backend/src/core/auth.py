@@ -1,12 +1,39 @@
-from appwrite.client import Client
-from appwrite.services.account import Account
-from appwrite.exception import AppwriteException
 from core.config import get_settings
-from typing import Optional
+from typing import Dict, Optional
 from fastapi import HTTPException, Request
+from utils.cache import TTLCache
+import asyncio
+import hashlib
+import httpx
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Validated sessions, keyed by a hash of the token so raw tokens are never held
+# in memory. The short TTL bounds how long a revoked session (e.g. after
+# sign-out) keeps working while still absorbing bursts of requests.
+_session_cache = TTLCache(maxsize=10_000, ttl=60)
+
+# Tokens Appwrite rejected are remembered briefly too, so repeated invalid
+# tokens are turned away in-process. Kept short so a user who just signed in
+# again is not locked out for long.
+_INVALID_SESSION = object()
+INVALID_SESSION_TTL = 10
+
+# Validations currently in flight, so concurrent requests carrying the same
+# token share a single Appwrite round-trip
+_inflight_sessions: Dict[bytes, "asyncio.Task[Optional[AppwriteUser]]"] = {}
+
+# Shared keep-alive pool for session validation. Only the per-request JWT
+# header changes between calls, so every validation reuses a warm connection.
+_account_client = httpx.AsyncClient(
+    base_url=settings.appwrite_endpoint,
+    headers={"X-Appwrite-Project": settings.appwrite_project_id or ""},
+    http2=True,
+    timeout=10.0,
+)
 
 
 class AppwriteUser:
@@ -20,6 +47,22 @@ class AppwriteUser:
         self.email_verification = user_data.get('emailVerification', False)
         self.labels = user_data.get('labels', [])
         self.registration = user_data.get('registration')
+        
+        # Dictionary form returned by the get_current_user dependency, built
+        # once per user object rather than on every request
+        self.data = {
+            "$id": self.id,
+            "email": self.email,
+            "name": self.name,
+            "emailVerification": self.email_verification,
+            "labels": self.labels,
+            "registration": self.registration
+        }
+
+
+def _session_cache_key(session_token: str) -> bytes:
+    """Hash a session token into a compact, non-reversible cache key."""
+    return hashlib.blake2b(session_token.encode(), digest_size=16).digest()
 
 
 async def verify_appwrite_session(session_token: str) -> Optional[AppwriteUser]:
@@ -34,8 +77,6 @@ async def verify_appwrite_session(session_token: str) -> Optional[AppwriteUser]:
         AppwriteUser if session is valid, None if invalid
     """
     try:
-        settings = get_settings()
-        
         if not settings.appwrite_project_id:
             logger.error("Appwrite project ID not configured. Set CLARIQ_APPWRITE_PROJECT_ID in .env")
             return None
@@ -44,44 +85,68 @@ async def verify_appwrite_session(session_token: str) -> Optional[AppwriteUser]:
             logger.warning("Empty session token provided")
             return None
         
-        # Connect to Appwrite with user's JWT token
-        client = Client()
-        client.set_endpoint(settings.appwrite_endpoint)
-        client.set_project(settings.appwrite_project_id)
-        client.set_jwt(session_token)  # Use JWT token for backend validation
+        cache_key = _session_cache_key(session_token)
+        cached_user = _session_cache.get(cache_key)
+        if cached_user is _INVALID_SESSION:
+            return None
+        if cached_user is not None:
+            return cached_user
         
-        # Try to get user info - this validates the session
-        account = Account(client)
-        user_data = account.get()  # If session is invalid, this throws exception
+        task = _inflight_sessions.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(_fetch_session_user(session_token, cache_key))
+            _inflight_sessions[cache_key] = task
+            task.add_done_callback(lambda _: _inflight_sessions.pop(cache_key, None))
         
-        logger.info(f"User authenticated: {user_data.get('email')}")
-        return AppwriteUser(user_data)
+        # Shield the shared task so one cancelled request doesn't fail the rest
+        return await asyncio.shield(task)
         
-    except AppwriteException as e:
-        logger.warning(f"Invalid Appwrite session: {e}")
+    except Exception as e:
+        logger.error(f"Unexpected auth error: {e}")
         return None
+
+
+async def _fetch_session_user(session_token: str, cache_key: bytes) -> Optional[AppwriteUser]:
+    """Validate a token against Appwrite and cache the resulting user."""
+    try:
+        # Fetch the account for the user's JWT - this validates the session
+        response = await _account_client.get(
+            "/account", headers={"X-Appwrite-JWT": session_token}
+        )
+        if response.is_error:
+            logger.warning(f"Invalid Appwrite session: {response.status_code} {response.text}")
+            # Only cache definite rejections, not Appwrite outages or throttling
+            if response.status_code in (401, 403):
+                _session_cache.set(cache_key, _INVALID_SESSION, ttl=INVALID_SESSION_TTL)
+            return None
+        
+        user_data = orjson.loads(response.content)
+        logger.info(f"User authenticated: {user_data.get('email')}")
+        user = AppwriteUser(user_data)
+        _session_cache.set(cache_key, user)
+        return user
+        
     except Exception as e:
         logger.error(f"Unexpected auth error: {e}")
         return None
 
 
+async def close_session_client() -> None:
+    """Close the connection pool used for session validation."""
+    await _account_client.aclose()
+
+
 def get_current_user(request: Request) -> dict:
     """
     Dependency to extract authenticated user from request state.
     Returns user data as dictionary for compatibility with existing code.
+    The dictionary is shared with the user object and must be treated as read-only.
     """
-    if not hasattr(request.state, 'user'):
+    user: Optional[AppwriteUser] = getattr(request.state, 'user', None)
+    if user is None:
         raise HTTPException(
             status_code=401, 
             detail="User information not found in request"
         )
     
-    user: AppwriteUser = request.state.user
-    return {
-        "$id": user.id,
-        "email": user.email,
-        "name": user.name,
-        "emailVerification": user.email_verification,
-        "labels": user.labels,
-        "registration": user.registration
-    }
\ No newline at end of file
+    return user.data
@@ -13,6 +13,12 @@ class Settings(BaseSettings):
     # Service Configuration
     service_name: str = "clariq-backend"
     service_version: str = "0.1.0"
+    host: str = "0.0.0.0"  # CLARIQ_HOST
+    port: int = 8000  # CLARIQ_PORT
+    workers: int = 1  # CLARIQ_WORKERS - uvicorn worker processes
+    
+    # CORS Configuration - frontend origins allowed to call the API
+    cors_origins: List[str] = ["http://localhost:3000"]  # CLARIQ_CORS_ORIGINS (JSON list)
     
     # Appwrite Configuration - REQUIRED for user authentication and database
     appwrite_endpoint: str = "https://cloud.appwrite.io/v1"
@@ -27,6 +33,9 @@ class Settings(BaseSettings):
     cerebras_api_key: Optional[str] = None  # CLARIQ_CEREBRAS_API_KEY
     exa_api_key: Optional[str] = None  # CLARIQ_EXA_API_KEY
     
+    # Research Configuration
+    llm_max_concurrency: int = 8  # CLARIQ_LLM_MAX_CONCURRENCY - Cerebras calls in flight across jobs
+    
     # Voice Agent Configuration
     livekit_api_key: Optional[str] = None  # CLARIQ_LIVEKIT_API_KEY
     livekit_api_secret: Optional[str] = None  # CLARIQ_LIVEKIT_API_SECRET
@@ -1,8 +1,12 @@
-from fastapi import FastAPI, HTTPException, Request, Query
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi import FastAPI, HTTPException, Request, Query, Response
+from fastapi.responses import HTMLResponse
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from datetime import datetime
+import asyncio
+import orjson
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # Add src directory to Python path
@@ -14,7 +18,13 @@ if str(src_path) not in sys.path:
 from middleware.cors import add_cors_middleware
 from middleware.security import SecurityHeadersMiddleware
 from middleware.auth import UserSessionMiddleware
+from core.auth import close_session_client
 from core.config import get_settings
+from services.appwrite_service import appwrite_service
+from services.cerebras_service import close_cerebras_service
+from services.exa_service import close_exa_service
+from schemas.responses import ORJSONResponse, response_meta_json
+from utils.timestamps import utc_now_iso
 
 # API router imports
 from api.auth import router as auth_router
@@ -22,6 +32,26 @@ from api.research import router as research_router
 
 settings = get_settings()
 
+# Threads available to blocking SDK calls (Exa, Cerebras) run via asyncio.to_thread
+BLOCKING_IO_WORKERS = 32
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: size the thread pool used for blocking SDK calls,
+    then release the shared Appwrite, Exa and Cerebras connection pools on
+    shutdown.
+    """
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=BLOCKING_IO_WORKERS)
+    )
+    yield
+    await appwrite_service.aclose()
+    await close_session_client()
+    await close_exa_service()
+    await close_cerebras_service()
+
 
 def create_app() -> FastAPI:
     """
@@ -33,54 +63,49 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
     
     # Add exception handlers
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "error": {
                     "code": exc.status_code,
                     "message": exc.detail,
                 },
-                "meta": {
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                    "service": settings.service_name,
-                    "version": settings.service_version,
-                }
+                "meta": response_meta_json()
             }
         )
     
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={
                 "error": {
                     "code": 422,
                     "message": "Validation error",
-                    "details": exc.errors()
+                    "details": jsonable_encoder(exc.errors())
                 },
-                "meta": {
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                    "service": settings.service_name,
-                    "version": settings.service_version,
-                }
+                "meta": response_meta_json()
             }
         )
     
-    # Add middleware in execution order (first added = last executed)
-    # 1. CORS - Handle preflight requests first
-    add_cors_middleware(app)
-    
-    # 2. Security Headers - Add security headers to all responses
+    # Add middleware (last added = outermost = first to see the request)
+    # 1. Security Headers - Add security headers to all responses
     app.add_middleware(SecurityHeadersMiddleware)
     
-    # 3. Authentication - Validate user sessions only
+    # 2. Authentication - Validate user sessions only
     app.add_middleware(UserSessionMiddleware)
     
+    # 3. CORS - Outermost, so preflights are answered before any other
+    #    middleware runs and auth errors still carry CORS headers
+    add_cors_middleware(app)
+    
     # Register API routes
     app.include_router(auth_router)
     app.include_router(research_router)
@@ -91,27 +116,53 @@ def create_app() -> FastAPI:
 app = create_app()
 
 
+# Health payload only changes with the (per-second) timestamp, so the encoded
+# body is rebuilt at most once per second and served as raw bytes
+_health_payload = ("", b"")
+
+
 @app.get("/health", tags=["system"])
 def get_health():
     """
     Basic liveness & readiness style probe.
     Extend later with checks (DB, Redis, external APIs).
     """
-    return JSONResponse(
-        {
-            "status": "ok",
-            "service": settings.service_name,
-            "version": settings.service_version,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "middleware": {
-                "cors": True,
-                "security_headers": True,
-                "user_session_auth": True,
-            },
-        }
-    )
+    global _health_payload
+    timestamp = utc_now_iso()
+    if _health_payload[0] != timestamp:
+        body = orjson.dumps(
+            {
+                "status": "ok",
+                "service": settings.service_name,
+                "version": settings.service_version,
+                "timestamp": timestamp,
+                "middleware": {
+                    "cors": True,
+                    "security_headers": True,
+                    "user_session_auth": True,
+                },
+            }
+        )
+        _health_payload = (timestamp, body)
+    return Response(content=_health_payload[1], media_type="application/json")
 
 
 @app.get("/", include_in_schema=False)
 def root():
-    return {"message": "CLARIQ API. See /health or /docs"}
\ No newline at end of file
+    return {"message": "CLARIQ API. See /health or /docs"}
+
+if __name__ == "__main__":
+    import uvicorn
+    
+    # uvloop + httptools come with uvicorn[standard]; uvloop has no Windows build.
+    # Access logging is off because it costs a synchronous write per request.
+    # The app is passed as an import string so multiple workers can load it.
+    uvicorn.run(
+        "main:app",
+        host=settings.host,
+        port=settings.port,
+        workers=settings.workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        access_log=False,
+    )
@@ -1,74 +1,132 @@
-from fastapi import HTTPException, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+import logging
+import re
+from fastapi import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 from core.auth import verify_appwrite_session
-from core.config import get_settings
+from schemas.responses import ORJSONResponse, response_meta_json
 
+logger = logging.getLogger(__name__)
 
-class UserSessionMiddleware(BaseHTTPMiddleware):
+# The frontend sends Appwrite JWTs (account.createJWT): three base64url
+# segments separated by dots. Anything else can be rejected without asking
+# Appwrite.
+_JWT_SHAPE_RE = re.compile(r"[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+")
+MIN_SESSION_TOKEN_LENGTH = 32
+
+BEARER_PREFIX = "Bearer "
+BEARER_PREFIX_LENGTH = len(BEARER_PREFIX)
+
+# Public paths that never require a session. Frozen set so the exact-path
+# check is a single hash lookup; shared by every middleware instance.
+DEFAULT_SKIP_PATHS = frozenset({
+    "/",
+    "/health",
+    "/v1/auth/test-connection",
+    "/v1/research/health",  # Research service health check
+    "/favicon.ico",
+    "/voice-agent",  # Public voice agent interface (uses token validation)
+})
+
+# Skip patterns for documentation and static resources
+SKIP_PATH_PREFIXES = (
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/static/",  # Static files for docs
+)
+# One anchored alternation checks every prefix in a single C-level match
+_SKIP_PATTERN_RE = re.compile(
+    "^(?:" + "|".join(map(re.escape, SKIP_PATH_PREFIXES)) + ")"
+)
+
+
+class UserSessionMiddleware:
     """
     User session authentication middleware supporting only Appwrite session tokens.
+    
+    Implemented as plain ASGI middleware rather than BaseHTTPMiddleware: skipped
+    paths are passed straight through without a per-request task and stream
+    pair, and rejected requests get the standard 401 error envelope directly.
     """
     
-    def __init__(self, app, skip_paths: list[str] = None):
-        super().__init__(app)
-        self.skip_paths = skip_paths or [
-            "/",
-            "/health",
-            "/v1/auth/test-connection",
-            "/v1/research/health",  # Research service health check
-            "/favicon.ico",
-            "/voice-agent",  # Public voice agent interface (uses token validation)
-        ]
-        # Skip patterns for documentation and static resources
-        self.skip_patterns = [
-            "/docs",
-            "/redoc", 
-            "/openapi.json",
-            "/static/",  # Static files for docs
-        ]
+    def __init__(self, app: ASGIApp, skip_paths: list[str] = None):
+        self.app = app
+        self.skip_paths = frozenset(skip_paths) if skip_paths else DEFAULT_SKIP_PATHS
     
-    async def dispatch(self, request: Request, call_next) -> Response:
-        path = request.url.path
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Always allow OPTIONS requests (CORS preflight)
-        if request.method == "OPTIONS":
-            return await call_next(request)
+        path = scope["path"]
+        
+        # Always allow OPTIONS requests. CORS answers real preflights before
+        # this runs; any other OPTIONS request is left to the app to answer.
+        if scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
         
         # Skip authentication for exact match paths
         if path in self.skip_paths:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
         
         # Skip authentication for pattern matches (docs and static files)
-        if any(path.startswith(pattern) for pattern in self.skip_patterns):
-            return await call_next(request)
+        if _SKIP_PATTERN_RE.match(path):
+            await self.app(scope, receive, send)
+            return
+        
+        request = Request(scope)
         
         # User session authentication only
         auth_header = request.headers.get("Authorization")
         if not auth_header:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"No Authorization header for {path}")
-            raise HTTPException(
-                status_code=401, 
-                detail="Authorization header required. Please sign in."
+            logger.warning("No Authorization header for %s", path)
+            await self._unauthorized(
+                scope, receive, send, "Authorization header required. Please sign in."
             )
+            return
         
         # Extract session token (remove "Bearer " if present)
-        session_token = auth_header.replace('Bearer ', '') if auth_header.startswith('Bearer ') else auth_header
+        session_token = (
+            auth_header[BEARER_PREFIX_LENGTH:] if auth_header.startswith(BEARER_PREFIX) else auth_header
+        )
         
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"Attempting to validate session: {session_token[:20]}... for {path}")
+        # Reject malformed tokens before spending a network round-trip on them
+        if len(session_token) < MIN_SESSION_TOKEN_LENGTH or not _JWT_SHAPE_RE.fullmatch(session_token):
+            logger.warning("Malformed session token rejected for %s", path)
+            await self._unauthorized(
+                scope, receive, send, "Invalid session token. Please sign in again."
+            )
+            return
+        
+        # Lazy %-style arguments: nothing is formatted unless INFO is enabled
+        logger.info("Attempting to validate session: %s... for %s", session_token[:20], path)
         
         # Validate with Appwrite
         user = await verify_appwrite_session(session_token)
         if not user:
-            logger.warning(f"Session validation failed for token: {session_token[:20]}...")
-            raise HTTPException(
-                status_code=401, 
-                detail="Invalid session token. Please sign in again."
+            logger.warning("Session validation failed for token: %s...", session_token[:20])
+            await self._unauthorized(
+                scope, receive, send, "Invalid session token. Please sign in again."
             )
+            return
         
         request.state.authenticated = True
         request.state.user = user  # Store user info for routes
-        return await call_next(request)
\ No newline at end of file
+        await self.app(scope, receive, send)
+    
+    @staticmethod
+    async def _unauthorized(scope: Scope, receive: Receive, send: Send, message: str) -> None:
+        """Send a 401 response in the same envelope as the HTTPException handler."""
+        response = ORJSONResponse(
+            status_code=401,
+            content={
+                "error": {
+                    "code": 401,
+                    "message": message,
+                },
+                "meta": response_meta_json()
+            }
+        )
+        await response(scope, receive, send)
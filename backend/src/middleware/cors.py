@@ -1,17 +1,24 @@
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import FastAPI
+from core.config import get_settings
+
+
+# Only what the frontend API client actually sends; explicit lists let
+# CORSMiddleware build its Access-Control-Allow-* headers once at startup
+CORS_ALLOW_METHODS = ["GET", "POST", "OPTIONS"]
+CORS_ALLOW_HEADERS = ["Authorization", "Content-Type"]
 
 
 def add_cors_middleware(app: FastAPI) -> None:
     """
     Add CORS middleware to allow cross-origin requests from frontend.
-    Currently configured for development environment - allows all origins.
-    TODO: Restrict origins in production.
+    Origins come from CLARIQ_CORS_ORIGINS (defaults to the local Next.js dev
+    server), so responses echo an exact origin instead of a wildcard.
     """
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],  # Allow all origins for development
+        allow_origins=get_settings().cors_origins,
         allow_credentials=True,  # For session cookies
-        allow_methods=["*"],  # Allow all methods
-        allow_headers=["*"],  # Allow all headers
-    )
\ No newline at end of file
+        allow_methods=CORS_ALLOW_METHODS,
+        allow_headers=CORS_ALLOW_HEADERS,
+    )
@@ -1,41 +1,71 @@
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+# Content Security Policy - Allow docs to function
+# For docs pages, we need to allow inline scripts and CDN resources
+DOCS_CSP = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://unpkg.com; "
+    "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://unpkg.com; "
+    "img-src 'self' data: https:; "
+    "font-src 'self' data: https://cdn.jsdelivr.net https://unpkg.com;"
+)
+# Strict CSP for API endpoints
+API_CSP = "default-src 'self'"
+
+DOCS_PATH_PREFIXES = ("/docs", "/redoc", "/openapi.json")
+
+
+def _security_headers(csp: str) -> list[tuple[bytes, bytes]]:
+    return [
+        # Prevent MIME type sniffing
+        (b"x-content-type-options", b"nosniff"),
+        # Prevent clickjacking (allow same origin for docs)
+        (b"x-frame-options", b"SAMEORIGIN"),
+        (b"content-security-policy", csp.encode("latin-1")),
+        # Referrer policy
+        (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    ]
+
+
+class SecurityHeadersMiddleware:
     """
     Adds security headers to all responses to prevent common web vulnerabilities.
+    
+    Both header sets are encoded once at construction. The middleware is plain
+    ASGI: the headers are added to the http.response.start message as it is
+    sent, with no per-request task or stream pair as in BaseHTTPMiddleware.
+    Like assigning response.headers, they replace any value the response set.
     """
     
-    async def dispatch(self, request: Request, call_next) -> Response:
-        response = await call_next(request)
-        
-        # Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        
-        # Prevent clickjacking (allow same origin for docs)
-        response.headers["X-Frame-Options"] = "SAMEORIGIN"
-        
-        # XSS protection (legacy but still useful)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._docs_headers = _security_headers(DOCS_CSP)
+        self._api_headers = _security_headers(API_CSP)
+        self._header_names = frozenset(name for name, _ in self._api_headers)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Content Security Policy - Allow docs to function
-        # For docs pages, we need to allow inline scripts and CDN resources
-        path = request.url.path
-        if path.startswith("/docs") or path.startswith("/redoc") or path == "/openapi.json":
+        if scope["path"].startswith(DOCS_PATH_PREFIXES):
             # Relaxed CSP for documentation pages
-            response.headers["Content-Security-Policy"] = (
-                "default-src 'self'; "
-                "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://unpkg.com; "
-                "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://unpkg.com; "
-                "img-src 'self' data: https:; "
-                "font-src 'self' data: https://cdn.jsdelivr.net https://unpkg.com;"
-            )
+            extra_headers = self._docs_headers
         else:
-            # Strict CSP for API endpoints
-            response.headers["Content-Security-Policy"] = "default-src 'self'"
+            extra_headers = self._api_headers
         
-        # Referrer policy
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        header_names = self._header_names
+        
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *(
+                        header for header in message.get("headers", ())
+                        if header[0].lower() not in header_names
+                    ),
+                    *extra_headers,
+                ]
+            await send(message)
         
-        return response
\ No newline at end of file
+        await self.app(scope, receive, send_with_headers)
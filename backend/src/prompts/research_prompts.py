@@ -190,9 +190,7 @@ def format_sources_for_prompt(sources: list, max_sources: int = 4, max_chars_per
     Returns:
         Formatted string of sources
     """
-    formatted = ""
-    for i, source in enumerate(sources[:max_sources], 1):
-        title = source.get('title', 'Unknown')
-        content = source.get('content', '')[:max_chars_per_source]
-        formatted += f"{i}. {title}: {content}...\n\n"
-    return formatted
+    return "".join(
+        f"{i}. {source.get('title', 'Unknown')}: {source.get('content', '')[:max_chars_per_source]}...\n\n"
+        for i, source in enumerate(sources[:max_sources], 1)
+    )
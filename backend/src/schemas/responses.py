@@ -1,6 +1,36 @@
 from pydantic import BaseModel
-from typing import Any, Optional
+from starlette.responses import JSONResponse
+from typing import Any, Dict, Optional
 from datetime import datetime
+import orjson
+
+from core.config import get_settings
+from utils.timestamps import utc_now_iso
+
+settings = get_settings()
+
+# Invariant part of the response meta block, built once at import
+_SERVICE_META = {
+    "service": settings.service_name,
+    "version": settings.service_version,
+}
+
+# (timestamp, meta block pre-encoded for that timestamp)
+_meta_fragment = ("", orjson.Fragment(b"{}"))
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson.
+    
+    Used instead of FastAPI's ORJSONResponse, which is deprecated in favour of
+    serializing response models through Pydantic and warns on every use. The
+    handlers here embed pre-encoded orjson.Fragment blocks (the meta block and
+    model_dump_json output), which only orjson can splice into the body.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 
 class ResponseMeta(BaseModel):
@@ -27,4 +57,24 @@ class ErrorDetail(BaseModel):
 class ErrorResponse(BaseModel):
     """Standard error response wrapper."""
     error: ErrorDetail
-    meta: ResponseMeta
\ No newline at end of file
+    meta: ResponseMeta
+
+
+def response_meta() -> Dict[str, str]:
+    """Build the meta block included in all API responses."""
+    return {"timestamp": utc_now_iso(), **_SERVICE_META}
+
+
+def response_meta_json() -> orjson.Fragment:
+    """
+    Get the meta block pre-encoded for responses serialized with orjson.
+    
+    The block only changes when the per-second timestamp does, so it is
+    encoded at most once per second and embedded verbatim in every response
+    built in between.
+    """
+    global _meta_fragment
+    timestamp = utc_now_iso()
+    if _meta_fragment[0] != timestamp:
+        _meta_fragment = (timestamp, orjson.Fragment(orjson.dumps(response_meta())))
+    return _meta_fragment[1]
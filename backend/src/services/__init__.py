@@ -2,7 +2,13 @@
 Services package for backend business logic.
 """
 
-from .appwrite_service import appwrite_service, AppwriteService, AppwriteServiceError
+from .appwrite_service import (
+    appwrite_service,
+    AppwriteService,
+    AppwriteServiceError,
+    research_job_loader,
+    ResearchJobLoader,
+)
 from .exa_service import get_exa_service, ExaService
 from .cerebras_service import get_cerebras_service, CerebrasService
 from .research_orchestrator import get_research_orchestrator, ResearchOrchestrator, ResearchOrchestrationError
@@ -11,6 +17,8 @@ __all__ = [
     "appwrite_service",
     "AppwriteService", 
     "AppwriteServiceError",
+    "research_job_loader",
+    "ResearchJobLoader",
     "get_exa_service",
     "ExaService",
     "get_cerebras_service",
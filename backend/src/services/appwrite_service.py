@@ -2,47 +2,154 @@
 Appwrite backend service for research job management.
 This service handles all database operations for research jobs.
 """
+import asyncio
 import logging
-from datetime import datetime
-from typing import Optional, Dict, Any, List
-from appwrite.client import Client
-from appwrite.services.databases import Databases
+import time
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, AsyncIterator, List, Set, Tuple
+import httpx
+import orjson
+from appwrite.query import Query
 from appwrite.exception import AppwriteException
 from core.config import get_settings
+from utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Appwrite processes at most this many documents per bulk request
+MAX_BULK_DOCUMENTS = 100
+
+# Appwrite error type for an endpoint the server doesn't have
+ROUTE_NOT_FOUND_ERROR = "general_route_not_found"
+
+# Documents are cached per process, and writes from other workers or from the
+# frontend don't invalidate them, so entries live only as long as the job
+# loader's (enough to absorb back-to-back reads of the same document)
+DOCUMENT_CACHE_SIZE = 1024
+DOCUMENT_CACHE_TTL = 1.0
+
+# Request bodies are encoded with orjson rather than httpx's stdlib encoder
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _now_iso() -> str:
+    """Current UTC time with microseconds, as stored in job timestamps."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
 
 class AppwriteService:
     """
     Service class for interacting with Appwrite database.
-    Handles all CRUD operations for research jobs.
+    Handles all CRUD operations for research jobs over Appwrite's REST API.
     """
     
-    def __init__(self):
-        self.client = Client()
-        self.client.set_endpoint(settings.appwrite_endpoint)
-        self.client.set_project(settings.appwrite_project_id)
-        self.client.set_key(settings.appwrite_api_key or "")
-        
-        self.databases = Databases(self.client)
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         self.database_id = settings.appwrite_database_id
         self.collection_id = settings.appwrite_research_collection_id
         self.voice_collection_id = settings.appwrite_voice_collection_id
         
+        # The research collection is addressed on every job read and write
+        self._research_documents_path = self._documents_path(self.database_id, self.collection_id)
+        
+        # Settings are fixed for the life of the process, so check them once
+        self._configured = bool(
+            settings.appwrite_project_id and 
+            settings.appwrite_api_key and
+            settings.appwrite_database_id and
+            settings.appwrite_research_collection_id
+        )
+        
+        # Long-lived HTTP/2 pool for all Appwrite REST calls, so requests reuse
+        # one TLS connection and never block the event loop
+        self.http = http_client or httpx.AsyncClient(
+            base_url=settings.appwrite_endpoint,
+            headers={
+                "X-Appwrite-Project": settings.appwrite_project_id,
+                "X-Appwrite-Key": settings.appwrite_api_key or "",
+            },
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+        
+        # Full documents read through this service, keyed by
+        # (database_id, collection_id, document_id). Writes made through the
+        # service replace or drop the entry, so repeated reads of a document
+        # skip the Appwrite round-trip.
+        self._document_cache = TTLCache(maxsize=DOCUMENT_CACHE_SIZE, ttl=DOCUMENT_CACHE_TTL)
+        
+        # Cleared once the server turns out not to have the bulk endpoints
+        # (Appwrite < 1.7), after which bulk updates fall back to single PATCHes
+        self._bulk_supported = True
+        
         # Log configuration status
         if self.is_configured():
             logger.info("Appwrite service configured successfully")
         else:
             logger.warning("Appwrite service not fully configured - some operations may fail")
     
-    async def get_research_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool."""
+        await self.http.aclose()
+    
+    @staticmethod
+    def _documents_path(database_id: str, collection_id: str) -> str:
+        """Build the REST path for the documents of a collection."""
+        return f"/databases/{database_id}/collections/{collection_id}/documents"
+    
+    def _document_path(self, collection_id: str, document_id: str, database_id: Optional[str] = None) -> str:
+        """Build the REST path for a document, defaulting to the configured database."""
+        return f"{self._documents_path(database_id or self.database_id, collection_id)}/{document_id}"
+    
+    async def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        """
+        Send a request to the Appwrite REST API over the shared client.
+        
+        Appwrite always answers with plain JSON objects, so the body is
+        decoded straight into a dict with orjson and needs no conversion.
+        A `json` body is likewise encoded with orjson.
+        
+        Raises:
+            AppwriteException: If Appwrite returns an error status
+        """
+        if "json" in kwargs:
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+            kwargs["headers"] = _JSON_HEADERS
+        response = await self.http.request(method, path, **kwargs)
+        self._raise_for_status(response)
+        return orjson.loads(response.content) if response.content else {}
+    
+    @staticmethod
+    def _raise_for_status(response: httpx.Response) -> None:
+        """Raise an AppwriteException for an error response (body must be read)."""
+        if not response.is_error:
+            return
+        try:
+            body = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            body = {}
+        raise AppwriteException(
+            body.get("message", response.text),
+            response.status_code,
+            body.get("type"),
+            response.text,
+        )
+    
+    async def get_research_job(
+        self, job_id: str, queries: Optional[List[str]] = None, no_cache: bool = False
+    ) -> Optional[Dict[str, Any]]:
         """
         Fetch a research job by ID from Appwrite.
         
+        Full documents are served from the document cache when possible;
+        projected reads (with queries) always go to Appwrite. Cached documents
+        are shared and must be treated as read-only.
+        
         Args:
             job_id: The unique identifier for the research job
+            queries: Optional queries, e.g. Query.select to limit the attributes returned
+            no_cache: Bypass the document cache and fetch fresh data
             
         Returns:
             Job document as dictionary, or None if not found
@@ -50,36 +157,46 @@ class AppwriteService:
         Raises:
             AppwriteException: If database operation fails
         """
+        cache_key = (self.database_id, self.collection_id, job_id)
+        use_cache = not queries
+        if use_cache and not no_cache:
+            cached = self._document_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
-            logger.info(f"Fetching research job {job_id} from Appwrite")
+            logger.info("Fetching research job %s from Appwrite", job_id)
             
-            response = self.databases.get_document(
-                database_id=self.database_id,
-                collection_id=self.collection_id,
-                document_id=job_id
+            response = await self._request(
+                "GET",
+                f"{self._research_documents_path}/{job_id}",
+                params={"queries[]": queries} if queries else None,
             )
             
-            logger.info(f"Successfully fetched job {job_id}")
+            logger.info("Successfully fetched job %s", job_id)
+            if use_cache:
+                self._document_cache.set(cache_key, response)
             return response
             
         except AppwriteException as e:
             if e.code == 404:
-                logger.warning(f"Research job {job_id} not found")
+                logger.warning("Research job %s not found", job_id)
                 return None
             else:
-                logger.error(f"Failed to fetch job {job_id}: {e.message}")
+                logger.error("Failed to fetch job %s: %s", job_id, e.message)
                 raise
         except Exception as e:
-            logger.error(f"Unexpected error fetching job {job_id}: {str(e)}")
+            logger.error("Unexpected error fetching job %s: %s", job_id, e)
             raise
     
-    async def update_research_job(self, job_id: str, data: Dict[str, Any]) -> bool:
+    async def update_research_job(self, job_id: str, data: Dict[str, Any], force: bool = False) -> bool:
         """
         Update a research job in Appwrite.
         
         Args:
             job_id: The unique identifier for the research job
             data: Dictionary of fields to update
+            force: Write even when there are no fields besides the timestamp
             
         Returns:
             True if update successful, False otherwise
@@ -87,30 +204,37 @@ class AppwriteService:
         Raises:
             AppwriteException: If database operation fails
         """
+        if not force and not data.keys() - {"updated_at"}:
+            return True
+        
+        cache_key = (self.database_id, self.collection_id, job_id)
+        self._document_cache.pop(cache_key)
+        
         try:
-            logger.info(f"Updating research job {job_id} with data: {list(data.keys())}")
+            logger.info("Updating research job %s with %d fields", job_id, len(data))
             
             # Add update timestamp
             update_data = {
                 **data,
-                "updated_at": datetime.utcnow().isoformat() + "Z"
+                "updated_at": _now_iso()
             }
             
-            response = self.databases.update_document(
-                database_id=self.database_id,
-                collection_id=self.collection_id,
-                document_id=job_id,
-                data=update_data
+            result = await self._request(
+                "PATCH",
+                f"{self._research_documents_path}/{job_id}",
+                json={"data": update_data},
             )
             
-            logger.info(f"Successfully updated job {job_id}")
+            # Appwrite returns the updated document
+            self._document_cache.set(cache_key, result)
+            logger.info("Successfully updated job %s", job_id)
             return True
             
         except AppwriteException as e:
-            logger.error(f"Failed to update job {job_id}: {e.message}")
+            logger.error("Failed to update job %s: %s", job_id, e.message)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error updating job {job_id}: {str(e)}")
+            logger.error("Unexpected error updating job %s: %s", job_id, e)
             raise
     
     async def update_job_status(self, job_id: str, status: str, error_message: Optional[str] = None) -> bool:
@@ -131,10 +255,72 @@ class AppwriteService:
             update_data["error_message"] = error_message
             
         if status == "completed":
-            update_data["completed_at"] = datetime.utcnow().isoformat() + "Z"
+            update_data["completed_at"] = _now_iso()
         
         return await self.update_research_job(job_id, update_data)
     
+    async def update_job_statuses(
+        self, job_ids: List[str], status: str, error_message: Optional[str] = None
+    ) -> int:
+        """
+        Set the same status on several research jobs with bulk updates.
+        
+        Args:
+            job_ids: Identifiers of the research jobs
+            status: New status (pending, processing, completed, failed)
+            error_message: Optional error message if status is failed
+            
+        Returns:
+            Number of jobs updated
+        """
+        if not job_ids:
+            return 0
+        
+        if len(job_ids) == 1 or not self._bulk_supported:
+            return await self._update_job_statuses_individually(job_ids, status, error_message)
+        
+        now_iso = _now_iso()
+        update_data = {"status": status, "updated_at": now_iso}
+        
+        if error_message:
+            update_data["error_message"] = error_message
+        
+        if status == "completed":
+            update_data["completed_at"] = now_iso
+        
+        try:
+            return await self.bulk_update_documents(
+                self.database_id, self.collection_id, job_ids, update_data
+            )
+        except AppwriteException as e:
+            if e.code != 404:
+                raise
+            # Only a missing route means the server has no bulk endpoints; any
+            # other 404 (e.g. a missing collection) only affects this batch
+            if e.type == ROUTE_NOT_FOUND_ERROR:
+                logger.warning("Appwrite bulk document updates unavailable, falling back to single updates")
+                self._bulk_supported = False
+            else:
+                logger.warning("Bulk status update failed (%s), falling back to single updates", e.message)
+            return await self._update_job_statuses_individually(job_ids, status, error_message)
+    
+    async def _update_job_statuses_individually(
+        self, job_ids: List[str], status: str, error_message: Optional[str]
+    ) -> int:
+        """
+        Update jobs one at a time. A failing job doesn't stop the others; the
+        first error is raised once all of them have been tried.
+        """
+        first_error: Optional[Exception] = None
+        for job_id in job_ids:
+            try:
+                await self.update_job_status(job_id, status, error_message)
+            except Exception as e:
+                first_error = first_error or e
+        if first_error is not None:
+            raise first_error
+        return len(job_ids)
+    
     async def update_job_results(self, job_id: str, results: str, total_sources: int) -> bool:
         """
         Update a research job with completed results.
@@ -151,7 +337,7 @@ class AppwriteService:
             "status": "completed",
             "results": results,
             "total_sources": total_sources,
-            "completed_at": datetime.utcnow().isoformat() + "Z"
+            "completed_at": _now_iso()
         }
         
         return await self.update_research_job(job_id, update_data)
@@ -172,74 +358,68 @@ class AppwriteService:
             Created document
         """
         try:
-            logger.info(f"Creating document {document_id} in collection {collection_id}")
+            logger.info("Creating document %s in collection %s", document_id, collection_id)
             
-            response = self.databases.create_document(
-                database_id=database_id,
-                collection_id=collection_id,
-                document_id=document_id,
-                data=data
+            result = await self._request(
+                "POST",
+                self._documents_path(database_id, collection_id),
+                json={"documentId": document_id, "data": data},
             )
             
-            # Convert response to dict
-            if hasattr(response, 'dict'):
-                result = response.dict()
-            elif hasattr(response, '__dict__'):
-                result = vars(response)
-            else:
-                result = dict(response) if response else {}
-            
-            logger.info(f"Successfully created document {document_id}")
+            self._document_cache.set((database_id, collection_id, result.get("$id", document_id)), result)
+            logger.info("Successfully created document %s", document_id)
             return result
             
         except AppwriteException as e:
-            logger.error(f"Failed to create document {document_id}: {e.message} (code: {e.code})")
+            logger.error("Failed to create document %s: %s (code: %s)", document_id, e.message, e.code)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error creating document {document_id}: {str(e)}", exc_info=True)
+            logger.error("Unexpected error creating document %s: %s", document_id, e, exc_info=True)
             raise
     
-    async def get_document(self, database_id: str, collection_id: str, document_id: str) -> Optional[Dict[str, Any]]:
+    async def get_document(
+        self, database_id: str, collection_id: str, document_id: str, no_cache: bool = False
+    ) -> Optional[Dict[str, Any]]:
         """
         Get a document from any collection.
         
+        Cached documents are shared and must be treated as read-only.
+        
         Args:
             database_id: Database ID
             collection_id: Collection ID
             document_id: Document ID
+            no_cache: Bypass the document cache and fetch fresh data
             
         Returns:
             Document data or None if not found
         """
+        cache_key = (database_id, collection_id, document_id)
+        if not no_cache:
+            cached = self._document_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
-            logger.info(f"Fetching document {document_id} from collection {collection_id}")
+            logger.info("Fetching document %s from collection %s", document_id, collection_id)
             
-            response = self.databases.get_document(
-                database_id=database_id,
-                collection_id=collection_id,
-                document_id=document_id
+            result = await self._request(
+                "GET", self._document_path(collection_id, document_id, database_id)
             )
             
-            # Convert response to dict
-            if hasattr(response, 'dict'):
-                result = response.dict()
-            elif hasattr(response, '__dict__'):
-                result = vars(response)
-            else:
-                result = dict(response) if response else {}
-            
-            logger.info(f"Successfully fetched document {document_id}")
+            self._document_cache.set(cache_key, result)
+            logger.info("Successfully fetched document %s", document_id)
             return result
             
         except AppwriteException as e:
             if e.code == 404:
-                logger.warning(f"Document {document_id} not found in {collection_id}")
+                logger.warning("Document %s not found in %s", document_id, collection_id)
                 return None
             else:
-                logger.error(f"Failed to fetch document {document_id}: {e.message} (code: {e.code})")
+                logger.error("Failed to fetch document %s: %s (code: %s)", document_id, e.message, e.code)
                 raise
         except Exception as e:
-            logger.error(f"Unexpected error fetching document {document_id}: {str(e)}", exc_info=True)
+            logger.error("Unexpected error fetching document %s: %s", document_id, e, exc_info=True)
             raise
     
     async def update_document(self, database_id: str, collection_id: str, document_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -255,32 +435,27 @@ class AppwriteService:
         Returns:
             Updated document
         """
+        cache_key = (database_id, collection_id, document_id)
+        self._document_cache.pop(cache_key)
+        
         try:
-            logger.info(f"Updating document {document_id} in collection {collection_id} with keys: {list(data.keys())}")
+            logger.info("Updating document %s in collection %s with %d fields", document_id, collection_id, len(data))
             
-            response = self.databases.update_document(
-                database_id=database_id,
-                collection_id=collection_id,
-                document_id=document_id,
-                data=data
+            result = await self._request(
+                "PATCH",
+                self._document_path(collection_id, document_id, database_id),
+                json={"data": data},
             )
             
-            # Convert response to dict
-            if hasattr(response, 'dict'):
-                result = response.dict()
-            elif hasattr(response, '__dict__'):
-                result = vars(response)
-            else:
-                result = dict(response) if response else {}
-            
-            logger.info(f"Successfully updated document {document_id}")
+            self._document_cache.set(cache_key, result)
+            logger.info("Successfully updated document %s", document_id)
             return result
             
         except AppwriteException as e:
-            logger.error(f"Failed to update document {document_id}: {e.message} (code: {e.code})")
+            logger.error("Failed to update document %s: %s (code: %s)", document_id, e.message, e.code)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error updating document {document_id}: {str(e)}", exc_info=True)
+            logger.error("Unexpected error updating document %s: %s", document_id, e, exc_info=True)
             raise
     
     async def list_documents(self, database_id: str, collection_id: str, queries: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -296,32 +471,176 @@ class AppwriteService:
             List response with documents and total count
         """
         try:
-            logger.info(f"Listing documents from collection {collection_id} with queries: {queries}")
+            logger.info("Listing documents from collection %s with queries: %s", collection_id, queries)
             
-            response = self.databases.list_documents(
-                database_id=database_id,
-                collection_id=collection_id,
-                queries=queries or []
+            result = await self._request(
+                "GET",
+                self._documents_path(database_id, collection_id),
+                params={"queries[]": queries} if queries else None,
             )
             
-            # Convert response to dict if it's not already
-            if hasattr(response, 'dict'):
-                result = response.dict()
-            elif hasattr(response, '__dict__'):
-                result = vars(response)
-            else:
-                result = dict(response) if response else {}
-            
-            logger.info(f"Successfully listed {len(result.get('documents', []))} documents from {collection_id}")
+            logger.info("Successfully listed %d documents from %s", len(result.get('documents', [])), collection_id)
             return result
             
         except AppwriteException as e:
-            logger.error(f"Failed to list documents from {collection_id}: {e.message} (code: {e.code})")
+            logger.error("Failed to list documents from %s: %s (code: %s)", collection_id, e.message, e.code)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error listing documents from {collection_id}: {str(e)}", exc_info=True)
+            logger.error("Unexpected error listing documents from %s: %s", collection_id, e, exc_info=True)
+            raise
+    
+    async def bulk_update_documents(
+        self, database_id: str, collection_id: str, document_ids: List[str], data: Dict[str, Any]
+    ) -> int:
+        """
+        Apply the same update to many documents of a collection.
+        
+        Uses Appwrite's bulk update endpoint, one request per
+        MAX_BULK_DOCUMENTS documents.
+        
+        Args:
+            database_id: Database ID
+            collection_id: Collection ID
+            document_ids: IDs of the documents to update
+            data: Update data
+            
+        Returns:
+            Number of documents updated
+            
+        Raises:
+            AppwriteException: If a bulk request fails (404 when the server
+                has no bulk endpoints)
+        """
+        logger.info("Bulk updating %d documents in collection %s with %d fields", len(document_ids), collection_id, len(data))
+        
+        updated = 0
+        for start in range(0, len(document_ids), MAX_BULK_DOCUMENTS):
+            chunk = document_ids[start:start + MAX_BULK_DOCUMENTS]
+            for document_id in chunk:
+                self._document_cache.pop((database_id, collection_id, document_id))
+            
+            result = await self._request(
+                "PATCH",
+                self._documents_path(database_id, collection_id),
+                json={"data": data, "queries": [Query.equal("$id", chunk)]},
+            )
+            updated += result.get("total", len(chunk))
+        
+        logger.info("Successfully bulk updated %d documents in %s", updated, collection_id)
+        return updated
+    
+    # Storage Methods
+    
+    async def upload_file(
+        self,
+        bucket_id: str,
+        file_content: bytes,
+        filename: str,
+        content_type: str = "application/octet-stream",
+        file_id: str = "unique()",
+    ) -> Dict[str, Any]:
+        """
+        Upload a file to Appwrite storage in a single multipart request.
+        
+        Appwrite only accepts single-request uploads up to 5MB, which covers
+        transcripts and reports.
+        
+        Args:
+            bucket_id: Storage bucket ID
+            file_content: Raw file bytes
+            filename: Name stored with the file
+            content_type: MIME type of the file
+            file_id: File ID, generated by Appwrite by default
+        
+        Returns:
+            Created file metadata
+        
+        Raises:
+            AppwriteException: If the upload fails
+        """
+        try:
+            logger.info("Uploading file %s to bucket %s", filename, bucket_id)
+            
+            result = await self._request(
+                "POST",
+                f"/storage/buckets/{bucket_id}/files",
+                data={"fileId": file_id},
+                files={"file": (filename, file_content, content_type)},
+            )
+            
+            logger.info("Successfully uploaded file %s", result.get('$id'))
+            return result
+        
+        except AppwriteException as e:
+            logger.error("Failed to upload file %s: %s (code: %s)", filename, e.message, e.code)
             raise
     
+    async def download_file(self, bucket_id: str, file_id: str) -> Optional[bytes]:
+        """
+        Download a file from Appwrite storage into memory.
+        
+        Prefer stream_file() for files that may be large.
+        
+        Args:
+            bucket_id: Storage bucket ID
+            file_id: File ID
+            
+        Returns:
+            File content, or None if not found
+        """
+        chunks = await self.stream_file(bucket_id, file_id)
+        if chunks is None:
+            return None
+        return b"".join([chunk async for chunk in chunks])
+    
+    async def stream_file(
+        self, bucket_id: str, file_id: str, chunk_size: int = 64 * 1024
+    ) -> Optional[AsyncIterator[bytes]]:
+        """
+        Open a streaming download of a file from Appwrite storage.
+        
+        The response status is checked before returning, so errors surface
+        here rather than part-way through the body. The connection is released
+        once the iterator is exhausted or closed.
+        
+        Args:
+            bucket_id: Storage bucket ID
+            file_id: File ID
+            chunk_size: Size of the chunks yielded
+            
+        Returns:
+            Async iterator over the file content, or None if not found
+            
+        Raises:
+            AppwriteException: If the download fails
+        """
+        logger.info("Streaming file %s from bucket %s", file_id, bucket_id)
+        
+        request = self.http.build_request(
+            "GET", f"/storage/buckets/{bucket_id}/files/{file_id}/download"
+        )
+        response = await self.http.send(request, stream=True)
+        
+        if response.is_error:
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            if response.status_code == 404:
+                logger.warning("File %s not found in bucket %s", file_id, bucket_id)
+                return None
+            logger.error("Failed to download file %s: %s", file_id, response.status_code)
+            self._raise_for_status(response)
+        
+        async def iter_content() -> AsyncIterator[bytes]:
+            try:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
+            finally:
+                await response.aclose()
+        
+        return iter_content()
+    
     def is_configured(self) -> bool:
         """
         Check if Appwrite service is properly configured.
@@ -329,18 +648,174 @@ class AppwriteService:
         Returns:
             True if all required settings are available
         """
-        return bool(
-            settings.appwrite_project_id and 
-            settings.appwrite_api_key and
-            settings.appwrite_database_id and
-            settings.appwrite_research_collection_id
-        )
+        return self._configured
 
 
 # Global service instance
 appwrite_service = AppwriteService()
 
 
+class ResearchJobLoader:
+    """
+    Coalesces concurrent research job lookups into batched Appwrite queries.
+    
+    Lookups issued within a short batching window are collected and resolved
+    with a single list_documents call (DataLoader pattern). Lookups for a job
+    whose fetch is already in flight share that fetch. Results are kept for a
+    short TTL so back-to-back execute/status requests for the same job are
+    served from memory.
+    """
+    
+    def __init__(
+        self,
+        service: AppwriteService,
+        batch_window: float = 0.005,
+        cache_ttl: float = 1.0,
+        max_batch_size: int = 100,
+        attributes: Optional[List[str]] = None
+    ):
+        self.service = service
+        self.batch_window = batch_window
+        self.cache_ttl = cache_ttl
+        self.max_batch_size = max_batch_size
+        self._select = [Query.select(attributes)] if attributes else []
+        
+        self._pending: Dict[str, asyncio.Future] = {}
+        # Futures of batches already sent to Appwrite, so lookups arriving
+        # while a fetch is in flight join it instead of starting another
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._dispatch_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+        # job_id -> (expires_at, document or None)
+        self._cache: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+    
+    async def load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a research job by ID, batching with other concurrent lookups.
+        
+        Args:
+            job_id: The unique identifier for the research job
+            
+        Returns:
+            Job document as dictionary, or None if not found
+        """
+        cached = self._cache.get(job_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        future = self._inflight.get(job_id) or self._pending.get(job_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[job_id] = future
+            
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._dispatch_handle is None:
+                self._dispatch_handle = loop.call_later(self.batch_window, self._dispatch)
+        
+        # Shield the shared future so one cancelled caller doesn't fail the rest
+        return await asyncio.shield(future)
+    
+    def clear(self, job_id: str) -> None:
+        """Drop any cached copy of a job, e.g. after it has been updated."""
+        self._cache.pop(job_id, None)
+        # A fetch already in flight may predate the update
+        self._inflight.pop(job_id, None)
+    
+    def _dispatch(self) -> None:
+        if self._dispatch_handle is not None:
+            self._dispatch_handle.cancel()
+            self._dispatch_handle = None
+        
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        self._inflight.update(batch)
+        
+        task = asyncio.ensure_future(self._fetch_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _fetch_batch(self, batch: Dict[str, asyncio.Future]) -> None:
+        job_ids = list(batch)
+        
+        try:
+            documents = await self._fetch_documents(job_ids)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            # Jobs cleared while the fetch was in flight are no longer tracked
+            # here; their (possibly stale) result is returned but not cached
+            current = {
+                job_id for job_id, future in batch.items()
+                if self._inflight.get(job_id) is future
+            }
+            for job_id in current:
+                del self._inflight[job_id]
+        
+        now = time.monotonic()
+        expires_at = now + self.cache_ttl
+        self._cache = {key: entry for key, entry in self._cache.items() if entry[0] > now}
+        
+        for job_id, future in batch.items():
+            document = documents.get(job_id)
+            if job_id in current:
+                self._cache[job_id] = (expires_at, document)
+            if not future.done():
+                future.set_result(document)
+    
+    async def _fetch_documents(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        if len(job_ids) == 1:
+            document = await self.service.get_research_job(job_ids[0], self._select)
+            return {job_ids[0]: document} if document else {}
+        
+        logger.info("Batch fetching %d research jobs from Appwrite", len(job_ids))
+        
+        try:
+            result = await self.service.list_documents(
+                database_id=self.service.database_id,
+                collection_id=self.service.collection_id,
+                queries=[Query.equal("$id", job_ids), Query.limit(len(job_ids)), *self._select]
+            )
+        except AppwriteException as e:
+            # One malformed ID rejects the whole query; fall back to single
+            # lookups so it can't fail the other requests in the batch
+            logger.warning("Batch job lookup failed (%s), fetching individually", e.message)
+            results = await asyncio.gather(
+                *(self.service.get_research_job(job_id, self._select) for job_id in job_ids),
+                return_exceptions=True
+            )
+            documents = {}
+            for job_id, result in zip(job_ids, results):
+                if isinstance(result, Exception):
+                    raise result
+                if result:
+                    documents[job_id] = result
+            return documents
+        
+        return {document["$id"]: document for document in result.get("documents", [])}
+
+
+# Attributes the request handlers read from a research job. Selecting only
+# these keeps the (potentially large) markdown results out of every status poll.
+JOB_SUMMARY_ATTRIBUTES = [
+    "$id",
+    "user_id",
+    "status",
+    "error_message",
+    "created_at",
+    "updated_at",
+]
+
+
+# Global loader instance for request handlers
+research_job_loader = ResearchJobLoader(appwrite_service, attributes=JOB_SUMMARY_ATTRIBUTES)
+
+
 class AppwriteServiceError(Exception):
     """Custom exception for Appwrite service errors."""
     def __init__(self, message: str, job_id: str, operation: str = "unknown"):
@@ -2,13 +2,32 @@
 Cerebras API Service Wrapper
 Provides AI analysis and synthesis using Cerebras Cloud SDK
 """
+import hashlib
 import logging
-from typing import Optional
-from cerebras.cloud.sdk import Cerebras
+import threading
+from functools import lru_cache
+from typing import AsyncIterator, Optional
+import httpx
+from cerebras.cloud.sdk import AsyncCerebras, Cerebras, DefaultAsyncHttpxClient, DefaultHttpxClient
 from core.config import settings
+from utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Research runs repeat identical prompts (the same target researched again,
+# retried jobs), so completions are reused for an hour
+RESPONSE_CACHE_SIZE = 512
+RESPONSE_CACHE_TTL = 60 * 60
+
+# Connection pool shared by all completions: a few warm keep-alive
+# connections for steady load, with room to burst for concurrent research jobs
+CEREBRAS_POOL_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=4)
+
+# The SDK retries rate limits (429) and server errors with exponential
+# backoff, honouring Retry-After; allow a few more attempts than its default
+# of 2 so bursts of research jobs don't surface as failed agents
+CEREBRAS_MAX_RETRIES = 4
+
 
 class CerebrasService:
     """Service wrapper for Cerebras API operations"""
@@ -19,25 +38,63 @@ class CerebrasService:
         if not self.api_key:
             raise ValueError("CEREBRAS_API_KEY not configured")
         
-        self.client = Cerebras(api_key=self.api_key)
+        self.client = Cerebras(
+            api_key=self.api_key,
+            http_client=DefaultHttpxClient(limits=CEREBRAS_POOL_LIMITS),
+            max_retries=CEREBRAS_MAX_RETRIES,
+        )
         self.model = "llama-4-scout-17b-16e-instruct"
+        
+        # Async client for streamed completions, created on first use
+        self._async_client: Optional[AsyncCerebras] = None
+        
+        # Exact-match response cache. Calls arrive from worker threads
+        # (asyncio.to_thread), so access is serialised with a lock.
+        self._response_cache = TTLCache(maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
+        self._response_cache_lock = threading.Lock()
         logger.info("Cerebras service initialized")
     
-    def ask_ai(self, prompt: str, max_tokens: int = 600, temperature: float = 0.2) -> str:
+    def _cache_key(self, prompt: str, max_tokens: int, temperature: float) -> bytes:
+        """Hash the request parameters into a compact cache key."""
+        key_source = f"{self.model}\0{max_tokens}\0{temperature}\0{prompt}"
+        return hashlib.blake2b(key_source.encode(), digest_size=16).digest()
+    
+    async def aclose(self) -> None:
+        """Close the Cerebras connection pools."""
+        self.client.close()
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+    
+    def ask_ai(
+        self, prompt: str, max_tokens: int = 600, temperature: float = 0.2, no_cache: bool = False
+    ) -> str:
         """
         Get AI response from Cerebras for analysis and insights
         
+        Identical requests within an hour are answered from an in-memory cache.
+        
         Args:
             prompt: The prompt to send to the AI
             max_tokens: Maximum tokens in response (default: 600)
             temperature: Randomness of response (default: 0.2 for consistency)
+            no_cache: Always call the API and don't cache the response
             
         Returns:
             AI response as string
         """
+        if not no_cache:
+            cache_key = self._cache_key(prompt, max_tokens, temperature)
+            with self._response_cache_lock:
+                cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("AI response served from cache (%d chars)", len(cached))
+                return cached
+        
         try:
-            logger.info(f"Asking AI (max_tokens={max_tokens}, temp={temperature})")
-            logger.debug(f"Prompt: {prompt[:100]}...")
+            logger.info("Asking AI (max_tokens=%s, temp=%s)", max_tokens, temperature)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Prompt: %s...", prompt[:100])
             
             chat_completion = self.client.chat.completions.create(
                 messages=[
@@ -52,14 +109,84 @@ class CerebrasService:
             )
             
             response = chat_completion.choices[0].message.content
-            logger.info(f"AI response received ({len(response)} chars)")
+            logger.info("AI response received (%d chars)", len(response))
+            
+            if not no_cache and response:
+                with self._response_cache_lock:
+                    self._response_cache.set(cache_key, response)
             return response
             
         except Exception as e:
-            logger.error(f"Error getting AI response: {str(e)}")
+            logger.error("Error getting AI response: %s", e)
             raise
     
-    def ask_ai_long(self, prompt: str, max_tokens: int = 1500, temperature: float = 0.2) -> str:
+    async def ask_ai_stream(
+        self, prompt: str, max_tokens: int = 600, temperature: float = 0.2, no_cache: bool = False
+    ) -> AsyncIterator[str]:
+        """
+        Stream an AI response from Cerebras as it is generated
+        
+        Lets consumers start on the first tokens instead of waiting for the
+        whole completion. A cached response is yielded in one piece, and a
+        completed stream is cached like ask_ai() responses.
+        
+        Args:
+            prompt: The prompt to send to the AI
+            max_tokens: Maximum tokens in response (default: 600)
+            temperature: Randomness of response (default: 0.2 for consistency)
+            no_cache: Always call the API and don't cache the response
+            
+        Yields:
+            Response text fragments in order
+        """
+        if not no_cache:
+            cache_key = self._cache_key(prompt, max_tokens, temperature)
+            with self._response_cache_lock:
+                cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("AI response served from cache (%d chars)", len(cached))
+                yield cached
+                return
+        
+        if self._async_client is None:
+            self._async_client = AsyncCerebras(
+                api_key=self.api_key,
+                http_client=DefaultAsyncHttpxClient(limits=CEREBRAS_POOL_LIMITS),
+                max_retries=CEREBRAS_MAX_RETRIES,
+            )
+        
+        logger.info("Streaming AI response (max_tokens=%s, temp=%s)", max_tokens, temperature)
+        stream = await self._async_client.chat.completions.create(
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt,
+                }
+            ],
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True
+        )
+        
+        parts = []
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            content = chunk.choices[0].delta.content
+            if content:
+                parts.append(content)
+                yield content
+        
+        response = "".join(parts)
+        logger.info("AI response streamed (%d chars)", len(response))
+        if not no_cache and response:
+            with self._response_cache_lock:
+                self._response_cache.set(cache_key, response)
+    
+    def ask_ai_long(
+        self, prompt: str, max_tokens: int = 1500, temperature: float = 0.2, no_cache: bool = False
+    ) -> str:
         """
         Get longer AI response for synthesis and comprehensive analysis
         
@@ -67,12 +194,13 @@ class CerebrasService:
             prompt: The prompt to send to the AI
             max_tokens: Maximum tokens in response (default: 1500 for longer responses)
             temperature: Randomness of response (default: 0.2 for consistency)
+            no_cache: Always call the API and don't cache the response
             
         Returns:
             AI response as string
         """
         logger.info("Asking AI for long-form response")
-        return self.ask_ai(prompt, max_tokens=max_tokens, temperature=temperature)
+        return self.ask_ai(prompt, max_tokens=max_tokens, temperature=temperature, no_cache=no_cache)
     
     def generate_follow_up_queries(self, context: str) -> str:
         """
@@ -101,13 +229,13 @@ class CerebrasService:
         return self.ask_ai_long(context, max_tokens=1500, temperature=0.2)
 
 
-# Global instance for easy import
-_cerebras_service: Optional[CerebrasService] = None
-
-
+@lru_cache()
 def get_cerebras_service() -> CerebrasService:
     """Get or create the global Cerebras service instance"""
-    global _cerebras_service
-    if _cerebras_service is None:
-        _cerebras_service = CerebrasService()
-    return _cerebras_service
+    return CerebrasService()
+
+
+async def close_cerebras_service() -> None:
+    """Close the Cerebras connection pools, if the service was ever created."""
+    if get_cerebras_service.cache_info().currsize:
+        await get_cerebras_service().aclose()
@@ -2,13 +2,25 @@
 Exa API Service Wrapper
 Provides search and discovery functionality using Exa's API
 """
+import asyncio
 import logging
-from typing import List, Dict, Optional
-from exa_py import Exa
+from functools import lru_cache
+from typing import Hashable, List, Dict, Optional
+from exa_py import AsyncExa
 from core.config import settings
+from utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on Exa requests in flight across all research jobs, to stay
+# within Exa's rate limits when agents fan out their searches
+MAX_CONCURRENT_SEARCHES = 8
+
+# Search results for the same query barely change within minutes, and the
+# same companies and people are researched repeatedly
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL = 15 * 60
+
 
 class ExaService:
     """Service wrapper for Exa API operations"""
@@ -19,10 +31,60 @@ class ExaService:
         if not self.api_key:
             raise ValueError("EXA_API_KEY not configured")
         
-        self.client = Exa(api_key=self.api_key)
+        # AsyncExa sends every request through one httpx.AsyncClient, so
+        # searches share keep-alive connections instead of blocking a thread
+        # each
+        self.client = AsyncExa(api_key=self.api_key)
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+        self._cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
         logger.info("Exa service initialized")
     
-    def search_web(self, query: str, num_results: int = 5) -> List[Dict]:
+    def _cached(self, key: Hashable) -> Optional[List[Dict]]:
+        """Return a copy of the cached results for `key`, or None on a miss."""
+        results = self._cache.get(key)
+        if results is None:
+            return None
+        logger.info("Exa cache hit for %s: %s", key[0], key[1])
+        # Callers extend and reorder result lists, so never hand out the cached one
+        return [dict(item) for item in results]
+    
+    def _store(self, key: Hashable, results: List[Dict]) -> None:
+        """Cache a copy of the results for `key`."""
+        self._cache.set(key, [dict(item) for item in results])
+    
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Drop one cached search.
+        
+        Args:
+            key: ("search_web", query, num_results),
+                ("find_similar_companies", url, num_results) or
+                ("search_person", name, linkedin_url)
+        """
+        self._cache.pop(key)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached search results."""
+        self._cache.clear()
+    
+    async def aclose(self) -> None:
+        """Close the Exa connection pool."""
+        await self.client.client.aclose()
+    
+    @staticmethod
+    def _to_dicts(result) -> List[Dict]:
+        """Convert an Exa response to the simple dict format used by the agents."""
+        return [
+            {
+                "title": item.title,
+                "url": item.url,
+                "content": item.text,
+                "score": getattr(item, 'score', None)
+            }
+            for item in result.results
+        ]
+    
+    async def search_web(self, query: str, num_results: int = 5) -> List[Dict]:
         """
         Search the web using Exa's auto search
         
@@ -33,34 +95,33 @@ class ExaService:
         Returns:
             List of search results with title, url, and content
         """
+        cache_key = ("search_web", query, num_results)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            logger.info(f"Searching web for: {query} (num_results={num_results})")
+            logger.info("Searching web for: %s (num_results=%d)", query, num_results)
             
-            result = self.client.search_and_contents(
-                query,
-                type="auto",
-                num_results=num_results,
-                text={"max_characters": 1000}
-            )
+            async with self._semaphore:
+                result = await self.client.search_and_contents(
+                    query,
+                    type="auto",
+                    num_results=num_results,
+                    text={"max_characters": 1000}
+                )
             
-            # Convert results to simple dict format
-            results = []
-            for item in result.results:
-                results.append({
-                    "title": item.title,
-                    "url": item.url,
-                    "content": item.text,
-                    "score": getattr(item, 'score', None)
-                })
+            results = self._to_dicts(result)
             
-            logger.info(f"Found {len(results)} results for query: {query}")
+            logger.info("Found %d results for query: %s", len(results), query)
+            self._store(cache_key, results)
             return results
             
         except Exception as e:
-            logger.error(f"Error searching web: {str(e)}")
+            logger.error("Error searching web: %s", e)
             raise
     
-    def find_similar_companies(self, url: str, num_results: int = 5) -> List[Dict]:
+    async def find_similar_companies(self, url: str, num_results: int = 5) -> List[Dict]:
         """
         Find similar companies using Exa's similarity search
         
@@ -71,35 +132,34 @@ class ExaService:
         Returns:
             List of similar companies with title, url, and content
         """
+        cache_key = ("find_similar_companies", url, num_results)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            logger.info(f"Finding similar companies to: {url}")
+            logger.info("Finding similar companies to: %s", url)
             
-            result = self.client.find_similar_and_contents(
-                url,
-                num_results=num_results,
-                category="company",
-                exclude_source_domain=True,
-                text={"max_characters": 1000}
-            )
+            async with self._semaphore:
+                result = await self.client.find_similar_and_contents(
+                    url,
+                    num_results=num_results,
+                    category="company",
+                    exclude_source_domain=True,
+                    text={"max_characters": 1000}
+                )
             
-            # Convert results to simple dict format
-            results = []
-            for item in result.results:
-                results.append({
-                    "title": item.title,
-                    "url": item.url,
-                    "content": item.text,
-                    "score": getattr(item, 'score', None)
-                })
+            results = self._to_dicts(result)
             
-            logger.info(f"Found {len(results)} similar companies")
+            logger.info("Found %d similar companies", len(results))
+            self._store(cache_key, results)
             return results
             
         except Exception as e:
-            logger.error(f"Error finding similar companies: {str(e)}")
+            logger.error("Error finding similar companies: %s", e)
             raise
     
-    def search_person(self, name: str, linkedin_url: Optional[str] = None) -> List[Dict]:
+    async def search_person(self, name: str, linkedin_url: Optional[str] = None) -> List[Dict]:
         """
         Search for a person's LinkedIn profile and information
         
@@ -110,47 +170,46 @@ class ExaService:
         Returns:
             List of search results about the person
         """
+        cache_key = ("search_person", name, linkedin_url)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             if linkedin_url:
-                logger.info(f"Searching for person with LinkedIn: {linkedin_url}")
+                logger.info("Searching for person with LinkedIn: %s", linkedin_url)
                 query = linkedin_url
             else:
-                logger.info(f"Searching for person: {name}")
+                logger.info("Searching for person: %s", name)
                 query = f"{name} LinkedIn profile"
             
-            result = self.client.search_and_contents(
-                query,
-                type="auto",
-                num_results=5,
-                category="linkedin profile",
-                text={"max_characters": 1000}
-            )
+            async with self._semaphore:
+                result = await self.client.search_and_contents(
+                    query,
+                    type="auto",
+                    num_results=5,
+                    category="linkedin profile",
+                    text={"max_characters": 1000}
+                )
             
-            # Convert results to simple dict format
-            results = []
-            for item in result.results:
-                results.append({
-                    "title": item.title,
-                    "url": item.url,
-                    "content": item.text,
-                    "score": getattr(item, 'score', None)
-                })
+            results = self._to_dicts(result)
             
-            logger.info(f"Found {len(results)} results for person: {name}")
+            logger.info("Found %d results for person: %s", len(results), name)
+            self._store(cache_key, results)
             return results
             
         except Exception as e:
-            logger.error(f"Error searching for person: {str(e)}")
+            logger.error("Error searching for person: %s", e)
             raise
 
 
-# Global instance for easy import
-_exa_service: Optional[ExaService] = None
-
-
+@lru_cache()
 def get_exa_service() -> ExaService:
     """Get or create the global Exa service instance"""
-    global _exa_service
-    if _exa_service is None:
-        _exa_service = ExaService()
-    return _exa_service
+    return ExaService()
+
+
+async def close_exa_service() -> None:
+    """Close the Exa connection pool, if the service was ever created."""
+    if get_exa_service.cache_info().currsize:
+        await get_exa_service().aclose()
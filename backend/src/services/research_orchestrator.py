@@ -5,9 +5,14 @@ Based on Anthropic's multi-agent approach and Perplexity-style deep research
 """
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional
+import re
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
+from core.config import settings
 from services.exa_service import get_exa_service
 from services.cerebras_service import get_cerebras_service
 from prompts.research_prompts import (
@@ -24,6 +29,129 @@ from prompts.research_prompts import (
 
 logger = logging.getLogger(__name__)
 
+# Query parameters that only track where a visitor came from. Exa returns the
+# same page with and without them, so they are dropped when comparing URLs.
+TRACKING_PARAMS = frozenset({
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'gclid', 'fbclid', 'mc_cid', 'mc_eid'
+})
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalise a URL so trivially different links to one page compare equal.
+    
+    Lowercases the scheme and host, drops the fragment, trailing slash and
+    tracking parameters, and sorts the remaining query parameters.
+    
+    Args:
+        url: URL as returned by a search
+        
+    Returns:
+        Canonical form of the URL
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    ))
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip('/'),
+        query,
+        ''
+    ))
+
+
+# A follow-up query line from the feedback loop: optional bullet or list
+# number, then at least 10 characters of query text
+_FOLLOW_UP_RE = re.compile(r'^\s*(?:[-*]|\d+[.)])?\s*(.{10,}?)\s*$')
+
+# Below this much compiled findings text (e.g. every agent failed) the
+# feedback loop is skipped rather than asking the model for gaps
+MIN_FEEDBACK_FINDINGS_CHARS = 200
+
+# Follow-up searches started speculatively while the feedback loop waits for
+# the model, appended to the research target
+SPECULATIVE_FOLLOW_UPS = ("latest news", "recent developments")
+
+
+class SourceCollector:
+    """
+    Accumulates search results, keeping the first source seen for each page.
+    Sources are compared by canonical URL; sources without a URL are dropped.
+    """
+    
+    def __init__(self):
+        self.sources: List[Dict[str, Any]] = []
+        self._seen = set()
+    
+    def add(self, source: Dict[str, Any]) -> bool:
+        """Add a source unless its page was already collected. Returns True if added."""
+        url = source.get('url')
+        if not url:
+            return False
+        key = canonical_url(url)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        self.sources.append(source)
+        return True
+    
+    def extend(self, sources: List[Dict[str, Any]]) -> None:
+        """Add each of the given sources in order."""
+        for source in sources:
+            self.add(source)
+
+
+class AgentOutputs:
+    """
+    Findings and sources compiled from the sub-agent results in a single pass,
+    shared by the feedback loop, the synthesis step and the final report.
+    """
+    
+    def __init__(self):
+        self.synthesis_parts: List[str] = []
+        self.feedback_parts: List[str] = []
+        self.all_sources: List[Dict[str, Any]] = []
+    
+    def add(self, agent_name: str, result: Any) -> None:
+        """Add one agent's result to the compiled findings and sources."""
+        if not isinstance(result, dict):
+            return
+        
+        if 'analysis' in result:
+            self.feedback_parts.append(f"**{agent_name.upper()}:**\n{result['analysis']}\n")
+            self.synthesis_parts.append(
+                f"## {agent_name.replace('_', ' ').title()}\n{result['analysis']}\n"
+            )
+        elif 'profile' in result:
+            self.feedback_parts.append(f"**{agent_name.upper()}:**\n{result['profile']}\n")
+        
+        if 'profile' in result:
+            self.synthesis_parts.append(f"## Person Profile\n{result['profile']}\n")
+        if 'talking_points' in result:
+            self.synthesis_parts.append(f"## Talking Points\n{result['talking_points']}\n")
+        if 'sources' in result:
+            self.all_sources.extend(result['sources'])
+    
+    @property
+    def synthesis_md(self) -> str:
+        """Markdown findings for the synthesis prompt."""
+        return "\n".join(self.synthesis_parts)
+    
+    @property
+    def feedback_md(self) -> str:
+        """Findings summary for the feedback loop prompt."""
+        return "\n".join(self.feedback_parts)
+    
+    @property
+    def total_sources(self) -> int:
+        """Number of sources across all agents."""
+        return len(self.all_sources)
+
 
 class ResearchOrchestrator:
     """
@@ -32,8 +160,14 @@ class ResearchOrchestrator:
     """
     
     def __init__(self):
+        # The Cerebras client is synchronous, so its calls are run in the
+        # default thread pool to keep the event loop free while agents run.
+        # The orchestrator is shared by all jobs, so the semaphore bounds
+        # Cerebras calls across concurrent research runs; Exa searches are
+        # bounded by ExaService itself.
         self.exa = get_exa_service()
         self.cerebras = get_cerebras_service()
+        self._llm_semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
         logger.info("Research Orchestrator initialized")
     
     async def run_multi_agent_research(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -46,7 +180,7 @@ class ResearchOrchestrator:
         Returns:
             Dict containing markdown_report, source_count, and metadata
         """
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         logger.info(f"Starting multi-agent research for target: {job_data.get('target')}")
         
         try:
@@ -71,19 +205,22 @@ class ResearchOrchestrator:
                 additional_context=additional_context
             )
             
+            # Compile findings and sources once for every later step
+            outputs = self._compile_agent_outputs(subagent_results)
+            
             # Step 3: Feedback Loop - Identify Gaps
             logger.info("Step 3: Feedback Loop - Gap Analysis")
-            follow_up_results = await self._feedback_loop(target, subagent_results)
+            follow_up_results = await self._feedback_loop(target, outputs)
             
             # Merge follow-up results
             if follow_up_results:
-                subagent_results['follow_up'] = follow_up_results
+                outputs.add('follow_up', follow_up_results)
             
             # Step 4: Final Synthesis
             logger.info("Step 4: Final Synthesis")
             synthesis = await self._synthesize_findings(
                 target=target,
-                subagent_results=subagent_results,
+                outputs=outputs,
                 enabled_agents=enabled_agents
             )
             
@@ -91,14 +228,13 @@ class ResearchOrchestrator:
             logger.info("Step 5: Formatting Report")
             from utils.report_formatter import format_research_report
             
-            # Collect all sources
-            all_sources = []
-            for agent_name, result in subagent_results.items():
-                if isinstance(result, dict) and 'sources' in result:
-                    all_sources.extend(result['sources'])
+            all_sources = outputs.all_sources
             
             # Calculate execution time
-            execution_time = (datetime.utcnow() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
+            # Naive UTC with microseconds, the format stored job results
+            # have always carried
+            completed_at = datetime.utcnow().isoformat()
             
             # Format final report
             markdown_report = format_research_report(
@@ -109,7 +245,7 @@ class ResearchOrchestrator:
                     'execution_time': execution_time,
                     'agents_used': enabled_agents,
                     'person_name': person_name,
-                    'timestamp': datetime.utcnow().isoformat()
+                    'timestamp': completed_at
                 }
             )
             
@@ -122,7 +258,7 @@ class ResearchOrchestrator:
                     'execution_time': execution_time,
                     'agents_used': enabled_agents,
                     'subtasks': subtasks,
-                    'timestamp': datetime.utcnow().isoformat()
+                    'timestamp': completed_at
                 }
             }
             
@@ -143,14 +279,16 @@ class ResearchOrchestrator:
             Dictionary of subtask descriptions
         """
         try:
+            # Agents are listed in a canonical order so jobs with the same
+            # agents build the same prompt and share CerebrasService's cache
             prompt = DELEGATION_PROMPT.format(
                 query=f"Comprehensive research on {target}",
                 target=target,
-                enabled_agents=', '.join(enabled_agents),
+                enabled_agents=', '.join(sorted(enabled_agents)),
                 additional_context=additional_context or 'None'
             )
             
-            response = self.cerebras.ask_ai(prompt, max_tokens=500)
+            response = await self._ask_llm(self.cerebras.ask_ai, prompt, max_tokens=500)
             
             # Parse subtasks (simplified - in production, use better parsing)
             subtasks = {
@@ -242,26 +380,17 @@ class ResearchOrchestrator:
                 f"{target} about company overview"
             ]
             
-            all_sources = []
-            
-            # Execute searches
-            for search_query in searches:
-                try:
-                    results = self.exa.search_web(search_query, num_results=3)
-                    all_sources.extend(results)
-                except Exception as e:
-                    logger.warning(f"Search failed for '{search_query}': {str(e)}")
+            search_tasks = {
+                search_query: self.exa.search_web(search_query, num_results=3)
+                for search_query in searches
+            }
             
-            # If target looks like a URL, try find_similar
+            # If target looks like a URL, also find similar companies
             if target.startswith('http://') or target.startswith('https://'):
-                try:
-                    similar = self.exa.find_similar_companies(target, num_results=3)
-                    all_sources.extend(similar)
-                except Exception as e:
-                    logger.warning(f"Find similar failed: {str(e)}")
+                search_tasks[f"similar to {target}"] = self.exa.find_similar_companies(target, num_results=3)
             
-            # Remove duplicates
-            unique_sources = self._deduplicate_sources(all_sources)
+            # Execute all searches concurrently
+            unique_sources = await self._run_searches(search_tasks)
             
             # Analyze with AI
             sources_text = format_sources_for_prompt(unique_sources, max_sources=5)
@@ -270,7 +399,7 @@ class ResearchOrchestrator:
                 sources=sources_text
             )
             
-            analysis = self.cerebras.ask_ai(prompt, max_tokens=800)
+            analysis = await self._ask_llm(self.cerebras.ask_ai, prompt, max_tokens=800)
             
             logger.info(f"Company Discovery complete: {len(unique_sources)} sources")
             
@@ -295,21 +424,22 @@ class ResearchOrchestrator:
         logger.info(f"Person Research Agent starting for: {person_name}")
         
         try:
-            # Search for person information
-            person_sources = self.exa.search_person(person_name, person_linkedin)
-            
-            # Also search for recent activity
-            try:
-                recent_results = self.exa.search_web(
-                    f"{person_name} recent news articles",
-                    num_results=3
-                )
-                person_sources.extend(recent_results)
-            except Exception as e:
-                logger.warning(f"Recent activity search failed: {str(e)}")
-            
-            # Remove duplicates
-            unique_sources = self._deduplicate_sources(person_sources)
+            # Search for person information and recent activity concurrently
+            person_results, recent_results = await asyncio.gather(
+                self.exa.search_person(person_name, person_linkedin),
+                self.exa.search_web(f"{person_name} recent news articles", num_results=3),
+                return_exceptions=True
+            )
+            if isinstance(person_results, Exception):
+                raise person_results
+            
+            collector = SourceCollector()
+            collector.extend(person_results)
+            if isinstance(recent_results, Exception):
+                logger.warning(f"Recent activity search failed: {str(recent_results)}")
+            else:
+                collector.extend(recent_results)
+            unique_sources = collector.sources
             
             # Extract profile
             sources_text = format_sources_for_prompt(unique_sources, max_sources=5)
@@ -318,15 +448,11 @@ class ResearchOrchestrator:
                 sources=sources_text
             )
             
-            profile = self.cerebras.ask_ai_long(profile_prompt, max_tokens=800)
-            
-            # Generate talking points
-            talking_points_prompt = TALKING_POINTS_PROMPT.format(
-                person_profile=profile,
-                person_name=person_name
-            )
+            profile = await self._ask_llm(self.cerebras.ask_ai_long, profile_prompt, max_tokens=800)
             
-            talking_points = self.cerebras.ask_ai(talking_points_prompt, max_tokens=500)
+            # Talking points build on every profile section, including the
+            # recent activity at the end, so they wait for the full profile
+            talking_points = await self._generate_talking_points(person_name, profile)
             
             logger.info(f"Person Research complete: {len(unique_sources)} sources")
             
@@ -341,6 +467,14 @@ class ResearchOrchestrator:
             logger.error(f"Person Research Agent error: {str(e)}")
             raise
     
+    async def _generate_talking_points(self, person_name: str, profile: str) -> str:
+        """Generate conversation talking points from a person profile."""
+        talking_points_prompt = TALKING_POINTS_PROMPT.format(
+            person_profile=profile,
+            person_name=person_name
+        )
+        return await self._ask_llm(self.cerebras.ask_ai, talking_points_prompt, max_tokens=500)
+    
     async def _market_analysis_agent(self, target: str) -> Dict[str, Any]:
         """
         Market Analysis Agent - Research market size, trends, and opportunities.
@@ -355,16 +489,10 @@ class ResearchOrchestrator:
                 f"{target} market opportunities growth"
             ]
             
-            all_sources = []
-            
-            for search_query in searches:
-                try:
-                    results = self.exa.search_web(search_query, num_results=3)
-                    all_sources.extend(results)
-                except Exception as e:
-                    logger.warning(f"Search failed for '{search_query}': {str(e)}")
-            
-            unique_sources = self._deduplicate_sources(all_sources)
+            unique_sources = await self._run_searches({
+                search_query: self.exa.search_web(search_query, num_results=3)
+                for search_query in searches
+            })
             
             # Analyze market
             sources_text = format_sources_for_prompt(unique_sources, max_sources=5)
@@ -373,7 +501,7 @@ class ResearchOrchestrator:
                 sources=sources_text
             )
             
-            analysis = self.cerebras.ask_ai_long(prompt, max_tokens=800)
+            analysis = await self._ask_llm(self.cerebras.ask_ai_long, prompt, max_tokens=800)
             
             logger.info(f"Market Analysis complete: {len(unique_sources)} sources")
             
@@ -401,24 +529,16 @@ class ResearchOrchestrator:
                 f"{target} competitive landscape"
             ]
             
-            all_sources = []
-            
-            for search_query in searches:
-                try:
-                    results = self.exa.search_web(search_query, num_results=3)
-                    all_sources.extend(results)
-                except Exception as e:
-                    logger.warning(f"Search failed for '{search_query}': {str(e)}")
+            search_tasks = {
+                search_query: self.exa.search_web(search_query, num_results=3)
+                for search_query in searches
+            }
             
-            # If target is URL, find similar companies
+            # If target is URL, find similar companies alongside the searches
             if target.startswith('http://') or target.startswith('https://'):
-                try:
-                    similar = self.exa.find_similar_companies(target, num_results=5)
-                    all_sources.extend(similar)
-                except Exception as e:
-                    logger.warning(f"Similar companies search failed: {str(e)}")
+                search_tasks[f"similar to {target}"] = self.exa.find_similar_companies(target, num_results=5)
             
-            unique_sources = self._deduplicate_sources(all_sources)
+            unique_sources = await self._run_searches(search_tasks)
             
             # Analyze competitors
             sources_text = format_sources_for_prompt(unique_sources, max_sources=6)
@@ -427,7 +547,7 @@ class ResearchOrchestrator:
                 sources=sources_text
             )
             
-            analysis = self.cerebras.ask_ai_long(prompt, max_tokens=800)
+            analysis = await self._ask_llm(self.cerebras.ask_ai_long, prompt, max_tokens=800)
             
             logger.info(f"Competitor Research complete: {len(unique_sources)} sources")
             
@@ -444,7 +564,7 @@ class ResearchOrchestrator:
     async def _feedback_loop(
         self,
         target: str,
-        subagent_results: Dict[str, Any]
+        outputs: AgentOutputs
     ) -> Optional[Dict[str, Any]]:
         """
         Feedback loop to identify gaps and execute follow-up searches.
@@ -452,20 +572,26 @@ class ResearchOrchestrator:
         Returns:
             Dictionary with follow-up results, or None if no gaps
         """
+        # Without findings from the agents there is nothing to find gaps in
+        findings = outputs.feedback_md
+        if len(findings) < MIN_FEEDBACK_FINDINGS_CHARS:
+            logger.info("Feedback loop: Not enough findings to analyse, skipping")
+            return None
+        
+        # Start the follow-up searches the model most often asks for while it
+        # looks for gaps. If gaps are found their results are merged into the
+        # follow-up sources; otherwise they are cancelled afterwards.
+        speculative = {
+            f"{target} {suffix}": asyncio.create_task(
+                self.exa.search_web(f"{target} {suffix}", num_results=2)
+            )
+            for suffix in SPECULATIVE_FOLLOW_UPS
+        }
+        
         try:
-            # Compile findings
-            findings_parts = []
-            for agent_name, result in subagent_results.items():
-                if isinstance(result, dict) and 'analysis' in result:
-                    findings_parts.append(f"**{agent_name.upper()}:**\n{result['analysis']}\n")
-                elif isinstance(result, dict) and 'profile' in result:
-                    findings_parts.append(f"**{agent_name.upper()}:**\n{result['profile']}\n")
-            
-            findings = "\n".join(findings_parts)
-            
             # Ask AI to identify gaps
             prompt = FEEDBACK_LOOP_PROMPT.format(findings=findings)
-            gaps_response = self.cerebras.ask_ai(prompt, max_tokens=300)
+            gaps_response = await self._ask_llm(self.cerebras.ask_ai, prompt, max_tokens=300)
             
             # Check if follow-up is needed
             if 'NONE' in gaps_response.upper() or not gaps_response.strip():
@@ -474,51 +600,56 @@ class ResearchOrchestrator:
             
             logger.info(f"Feedback loop: Gaps identified, executing follow-up")
             
-            # Parse follow-up queries (simple parsing)
-            lines = gaps_response.strip().split('\n')
+            # Parse follow-up queries, one per line
             follow_up_queries = [
-                line.strip('- ').strip('1234567890. ').strip()
-                for line in lines
-                if line.strip() and len(line.strip()) > 10
+                match.group(1)
+                for match in map(_FOLLOW_UP_RE.match, gaps_response.splitlines())
+                if match
             ][:3]  # Max 3 follow-ups
             
-            # Execute follow-up searches
-            follow_up_sources = []
-            for query in follow_up_queries:
-                try:
-                    results = self.exa.search_web(query, num_results=2)
-                    follow_up_sources.extend(results)
-                except Exception as e:
-                    logger.warning(f"Follow-up search failed for '{query}': {str(e)}")
+            # Execute follow-up searches concurrently. The model words its
+            # queries freely, so the prefetched searches are not matched
+            # against them; their results are always used alongside them.
+            prefetched = {query.lower() for query in speculative}
+            searches = {
+                query: self.exa.search_web(query, num_results=2)
+                for query in dict.fromkeys(follow_up_queries)
+                if query.lower() not in prefetched
+            }
+            searches.update(speculative)
+            unique_sources = await self._run_searches(searches)
             
-            if not follow_up_sources:
+            if not unique_sources:
                 return None
             
-            unique_sources = self._deduplicate_sources(follow_up_sources)
-            
             # Analyze follow-up findings
-            sources_text = format_sources_for_prompt(unique_sources, max_sources=4)
+            sources_text = format_sources_for_prompt(unique_sources, max_sources=6)
             analysis_prompt = f"Based on these additional sources about {target}, provide key insights:\n\n{sources_text}"
             
-            analysis = self.cerebras.ask_ai(analysis_prompt, max_tokens=400)
+            analysis = await self._ask_llm(self.cerebras.ask_ai, analysis_prompt, max_tokens=400)
             
             logger.info(f"Feedback loop complete: {len(unique_sources)} additional sources")
             
             return {
                 'analysis': analysis,
                 'sources': unique_sources,
-                'queries': follow_up_queries,
+                'queries': list(searches),
                 'agent': 'follow_up'
             }
             
         except Exception as e:
             logger.error(f"Feedback loop error: {str(e)}")
             return None
+        
+        finally:
+            for task in speculative.values():
+                task.cancel()
+            await asyncio.gather(*speculative.values(), return_exceptions=True)
     
     async def _synthesize_findings(
         self,
         target: str,
-        subagent_results: Dict[str, Any],
+        outputs: AgentOutputs,
         enabled_agents: List[str]
     ) -> str:
         """
@@ -527,43 +658,17 @@ class ResearchOrchestrator:
         Returns:
             Synthesized report text
         """
+        subagent_findings = outputs.synthesis_md
         try:
-            # Compile all findings
-            findings_parts = []
-            
-            for agent_name, result in subagent_results.items():
-                if isinstance(result, dict):
-                    if 'analysis' in result:
-                        findings_parts.append(
-                            f"## {agent_name.replace('_', ' ').title()}\n{result['analysis']}\n"
-                        )
-                    if 'profile' in result:
-                        findings_parts.append(
-                            f"## Person Profile\n{result['profile']}\n"
-                        )
-                    if 'talking_points' in result:
-                        findings_parts.append(
-                            f"## Talking Points\n{result['talking_points']}\n"
-                        )
-            
-            subagent_findings = "\n".join(findings_parts)
-            
-            # Count total sources
-            total_sources = sum(
-                len(result.get('sources', []))
-                for result in subagent_results.values()
-                if isinstance(result, dict)
-            )
-            
             # Synthesize with AI
             prompt = MULTI_AGENT_SYNTHESIS_PROMPT.format(
                 query=target,
                 subagent_findings=subagent_findings,
-                total_sources=total_sources,
+                total_sources=outputs.total_sources,
                 num_agents=len(enabled_agents)
             )
             
-            synthesis = self.cerebras.synthesize_research(prompt)
+            synthesis = await self._ask_llm(self.cerebras.synthesize_research, prompt)
             
             logger.info("Synthesis complete")
             
@@ -574,18 +679,57 @@ class ResearchOrchestrator:
             # Return basic findings if synthesis fails
             return subagent_findings
     
-    def _deduplicate_sources(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate sources based on URL."""
-        seen_urls = set()
-        unique = []
+    async def _ask_llm(self, method: Callable[..., str], *args: Any, **kwargs: Any) -> str:
+        """
+        Run a blocking CerebrasService call in the thread pool, waiting for a
+        free slot when too many calls are already in flight.
         
-        for source in sources:
-            url = source.get('url', '')
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique.append(source)
+        Args:
+            method: CerebrasService method to call, e.g. self.cerebras.ask_ai
+            *args, **kwargs: Arguments for the method
+            
+        Returns:
+            The method's response text
+        """
+        async with self._llm_semaphore:
+            return await asyncio.to_thread(method, *args, **kwargs)
+    
+    def _compile_agent_outputs(self, results: Dict[str, Any]) -> AgentOutputs:
+        """
+        Compile the findings and sources of all agents in one pass.
+        
+        Args:
+            results: Agent results keyed by agent name
+            
+        Returns:
+            AgentOutputs with the feedback and synthesis findings and all sources
+        """
+        outputs = AgentOutputs()
+        for agent_name, result in results.items():
+            outputs.add(agent_name, result)
+        return outputs
+    
+    async def _run_searches(
+        self, searches: Dict[str, Awaitable[List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run independent searches concurrently and merge their results.
+        
+        Args:
+            searches: Search coroutines keyed by their query, for logging
+            
+        Returns:
+            Unique results of the searches that succeeded, in query order
+        """
+        results = await asyncio.gather(*searches.values(), return_exceptions=True)
         
-        return unique
+        collector = SourceCollector()
+        for search_query, result in zip(searches, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Search failed for '{search_query}': {str(result)}")
+            else:
+                collector.extend(result)
+        return collector.sources
 
 
 class ResearchOrchestrationError(Exception):
@@ -593,13 +737,7 @@ class ResearchOrchestrationError(Exception):
     pass
 
 
-# Global instance
-_orchestrator: Optional[ResearchOrchestrator] = None
-
-
+@lru_cache()
 def get_research_orchestrator() -> ResearchOrchestrator:
     """Get or create the global research orchestrator instance."""
-    global _orchestrator
-    if _orchestrator is None:
-        _orchestrator = ResearchOrchestrator()
-    return _orchestrator
+    return ResearchOrchestrator()
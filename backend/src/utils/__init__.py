@@ -2,11 +2,16 @@
 Utility modules for the CLARIQ backend.
 """
 
+from .cache import TTLCache
 from .rate_limiting import check_research_rate_limit, rate_limiter
 from .report_formatter import format_research_report
+from .timestamps import utc_iso_after, utc_now_iso
 
 __all__ = [
+    "TTLCache",
     "check_research_rate_limit",
     "rate_limiter",
     "format_research_report",
+    "utc_iso_after",
+    "utc_now_iso",
 ]
\ No newline at end of file
@@ -4,18 +4,52 @@ This is a basic implementation for MVP. For production, consider using
 Redis-based rate limiting or a service like Upstash.
 """
 from fastapi import HTTPException, Request
-from typing import Dict, List
-from datetime import datetime, timedelta
+from typing import Dict, Tuple
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 
+class TokenBucket:
+    """
+    Token bucket that refills continuously to `capacity` tokens per window.
+    
+    A check is a float refill plus a compare - no per-request timestamps
+    are stored or scanned.
+    """
+    __slots__ = ("capacity", "refill_rate", "tokens", "last_refill")
+    
+    def __init__(self, capacity: int, window_seconds: float):
+        self.capacity = capacity
+        self.refill_rate = capacity / window_seconds
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+    
+    def try_take(self, amount: float = 1.0) -> bool:
+        """Take `amount` tokens if available. Returns False when rate limited."""
+        self._refill()
+        if self.tokens < amount:
+            return False
+        self.tokens -= amount
+        return True
+    
+    def remaining(self) -> int:
+        """Number of whole tokens currently available."""
+        self._refill()
+        return int(self.tokens)
+
+
 class SimpleRateLimiter:
     """
     In-memory rate limiter for research endpoints.
     
-    This implementation tracks requests per user and enforces limits
+    This implementation keeps a token bucket per user and endpoint type
     to prevent abuse of the research API which uses external paid APIs.
     
     Note: This is not suitable for multi-instance deployments as it
@@ -24,24 +58,26 @@ class SimpleRateLimiter:
     """
     
     def __init__(self):
-        # Store: user_id -> List[timestamp]
-        self._user_requests: Dict[str, List[datetime]] = {}
+        # Store: (user_id, endpoint_type) -> TokenBucket
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
         
         # Rate limits
         self.RESEARCH_EXECUTION_LIMIT = 5  # Max 5 research jobs per hour
         self.STATUS_CHECK_LIMIT = 60       # Max 60 status checks per hour
         self.WINDOW_HOURS = 1
     
-    def _cleanup_old_requests(self, user_id: str) -> None:
-        """Remove requests older than the time window."""
-        if user_id not in self._user_requests:
-            return
-            
-        cutoff_time = datetime.utcnow() - timedelta(hours=self.WINDOW_HOURS)
-        self._user_requests[user_id] = [
-            req_time for req_time in self._user_requests[user_id] 
-            if req_time > cutoff_time
-        ]
+    def _get_limit(self, endpoint_type: str) -> int:
+        if endpoint_type == "execution":
+            return self.RESEARCH_EXECUTION_LIMIT
+        return self.STATUS_CHECK_LIMIT
+    
+    def _get_bucket(self, user_id: str, endpoint_type: str) -> TokenBucket:
+        key = (user_id, endpoint_type)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self._get_limit(endpoint_type), self.WINDOW_HOURS * 3600)
+            self._buckets[key] = bucket
+        return bucket
     
     def check_rate_limit(self, user_id: str, endpoint_type: str = "execution") -> bool:
         """
@@ -54,42 +90,18 @@ class SimpleRateLimiter:
         Returns:
             True if request is allowed, False if rate limited
         """
-        self._cleanup_old_requests(user_id)
-        
-        if user_id not in self._user_requests:
-            self._user_requests[user_id] = []
+        if self._get_bucket(user_id, endpoint_type).try_take():
+            return True
         
-        current_requests = len(self._user_requests[user_id])
-        
-        if endpoint_type == "execution":
-            limit = self.RESEARCH_EXECUTION_LIMIT
-        else:  # status
-            limit = self.STATUS_CHECK_LIMIT
-        
-        if current_requests >= limit:
-            logger.warning(f"Rate limit exceeded for user {user_id}, endpoint {endpoint_type}: {current_requests}/{limit}")
-            return False
-            
-        # Record this request
-        self._user_requests[user_id].append(datetime.utcnow())
-        return True
+        logger.warning(f"Rate limit exceeded for user {user_id}, endpoint {endpoint_type}")
+        return False
     
     def get_remaining_requests(self, user_id: str, endpoint_type: str = "execution") -> int:
         """Get the number of remaining requests for a user."""
-        self._cleanup_old_requests(user_id)
-        
-        if user_id not in self._user_requests:
-            if endpoint_type == "execution":
-                return self.RESEARCH_EXECUTION_LIMIT
-            else:
-                return self.STATUS_CHECK_LIMIT
-        
-        current_requests = len(self._user_requests[user_id])
-        
-        if endpoint_type == "execution":
-            return max(0, self.RESEARCH_EXECUTION_LIMIT - current_requests)
-        else:
-            return max(0, self.STATUS_CHECK_LIMIT - current_requests)
+        bucket = self._buckets.get((user_id, endpoint_type))
+        if bucket is None:
+            return self._get_limit(endpoint_type)
+        return bucket.remaining()
 
 
 # Global rate limiter instance
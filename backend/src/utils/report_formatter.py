@@ -3,9 +3,23 @@ Research Report Formatter
 Generates professional markdown reports from research findings
 """
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Final, Optional
 from datetime import datetime
 
+# Static "About This Report" footer, identical for every report
+REPORT_FOOTER: Final[str] = (
+    "## About This Report\n"
+    "\n"
+    "This report was generated by **CLARIQ Research Agents**, a multi-agent AI system that:\n"
+    "\n"
+    "- 🔍 Searches and analyzes web sources using Exa AI\n"
+    "- 🤖 Synthesizes insights using Cerebras AI (Llama 4 Scout)\n"
+    "- 🎯 Employs specialized agents for different research aspects\n"
+    "- 🔄 Includes feedback loops to identify and fill information gaps\n"
+    "\n"
+    "*For questions or feedback, please contact your research administrator.*\n"
+)
+
 
 def format_research_report(
     target: str,
@@ -103,17 +117,7 @@ def format_research_report(
     report_parts.append("")
     
     # Footer
-    report_parts.append("## About This Report")
-    report_parts.append("")
-    report_parts.append("This report was generated by **CLARIQ Research Agents**, a multi-agent AI system that:")
-    report_parts.append("")
-    report_parts.append("- 🔍 Searches and analyzes web sources using Exa AI")
-    report_parts.append("- 🤖 Synthesizes insights using Cerebras AI (Llama 4 Scout)")
-    report_parts.append("- 🎯 Employs specialized agents for different research aspects")
-    report_parts.append("- 🔄 Includes feedback loops to identify and fill information gaps")
-    report_parts.append("")
-    report_parts.append("*For questions or feedback, please contact your research administrator.*")
-    report_parts.append("")
+    report_parts.append(REPORT_FOOTER)
     
     # Join all parts
     return "\n".join(report_parts)
@@ -0,0 +1,56 @@
+"""
+Timestamp helpers for API responses.
+"""
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Tuple
+
+_ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# (epoch second, formatted string) - swapped as one tuple so readers never
+# see a second/string pair from different ticks
+_cached_timestamp = (-1, "")
+
+# offset in seconds -> (epoch second, formatted string)
+_cached_offsets: Dict[int, Tuple[int, str]] = {}
+
+
+def utc_now_iso() -> str:
+    """
+    Get the current UTC time as an ISO-8601 string with a trailing "Z".
+    
+    Response timestamps only need one-second resolution, so the formatted
+    string is built once per second and reused by every call in between.
+    
+    Returns:
+        Timestamp such as "2025-01-01T12:00:00Z"
+    """
+    global _cached_timestamp
+    now = int(time.time())
+    cached_second, cached_iso = _cached_timestamp
+    if now != cached_second:
+        cached_iso = datetime.fromtimestamp(now, timezone.utc).strftime(_ISO_FORMAT)
+        _cached_timestamp = (now, cached_iso)
+    return cached_iso
+
+
+def utc_iso_after(delta: timedelta) -> str:
+    """
+    Get the UTC time `delta` from now as an ISO-8601 string with a trailing "Z".
+    
+    Like utc_now_iso(), the string is formatted at most once per second
+    for each distinct offset.
+    
+    Args:
+        delta: Offset from the current time
+        
+    Returns:
+        Timestamp such as "2025-01-01T12:12:00Z"
+    """
+    offset = int(delta.total_seconds())
+    now = int(time.time())
+    cached_second, cached_iso = _cached_offsets.get(offset, (-1, ""))
+    if now != cached_second:
+        cached_iso = datetime.fromtimestamp(now + offset, timezone.utc).strftime(_ISO_FORMAT)
+        _cached_offsets[offset] = (now, cached_iso)
+    return cached_iso
@@ -3,11 +3,14 @@ Transcript processing utilities for voice sessions.
 """
 
 import json
+import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, AsyncIterator
 from services.appwrite_service import appwrite_service
 from core.config import get_settings
 
+logger = logging.getLogger(__name__)
+
 
 class TranscriptProcessor:
     """Process and format voice conversation transcripts."""
@@ -48,7 +51,7 @@ class TranscriptProcessor:
             return "\n".join(transcript_lines)
             
         except Exception as e:
-            print(f"Error formatting conversation history: {e}")
+            logger.error("Error formatting conversation history: %s", e)
             return "Error formatting transcript"
     
     def extract_conversation_insights(self, conversation_data: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -97,7 +100,7 @@ class TranscriptProcessor:
             return insights
             
         except Exception as e:
-            print(f"Error extracting insights: {e}")
+            logger.error("Error extracting insights: %s", e)
             return {"error": str(e)}
     
     async def save_transcript_to_storage(self, session_id: str, transcript_content: str) -> Optional[str]:
@@ -130,13 +133,16 @@ class TranscriptProcessor:
             return None
             
         except Exception as e:
-            print(f"Error saving transcript to storage: {e}")
+            logger.error("Error saving transcript to storage: %s", e)
             return None
     
     async def get_transcript_from_storage(self, file_id: str) -> Optional[str]:
         """
         Retrieve transcript from Appwrite storage.
         
+        Loads the whole transcript into memory; use stream_transcript_from_storage
+        when the content is passed straight through to a response.
+        
         Args:
             file_id: Appwrite file identifier
             
@@ -156,7 +162,30 @@ class TranscriptProcessor:
             return None
             
         except Exception as e:
-            print(f"Error retrieving transcript from storage: {e}")
+            logger.error("Error retrieving transcript from storage: %s", e)
+            return None
+    
+    async def stream_transcript_from_storage(self, file_id: str) -> Optional[AsyncIterator[bytes]]:
+        """
+        Stream a transcript from Appwrite storage in chunks.
+        
+        Memory use stays constant regardless of transcript size, so the result
+        can be handed directly to a StreamingResponse.
+        
+        Args:
+            file_id: Appwrite file identifier
+            
+        Returns:
+            Async iterator over the UTF-8 transcript bytes, or None if not found
+        """
+        try:
+            return await appwrite_service.stream_file(
+                bucket_id=self.settings.appwrite_transcript_bucket_id,
+                file_id=file_id
+            )
+            
+        except Exception as e:
+            logger.error("Error streaming transcript from storage: %s", e)
             return None
     
     def create_transcript_summary(self, transcript: str) -> Dict[str, Any]:
@@ -186,7 +215,7 @@ class TranscriptProcessor:
             return summary
             
         except Exception as e:
-            print(f"Error creating transcript summary: {e}")
+            logger.error("Error creating transcript summary: %s", e)
             return {"error": str(e)}
 
 
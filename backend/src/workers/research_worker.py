@@ -10,6 +10,11 @@ from services.appwrite_service import appwrite_service, AppwriteServiceError
 
 logger = logging.getLogger(__name__)
 
+# A job whose "failed" status never lands stays "processing" forever, so that
+# write is retried with exponential backoff before giving up
+FAILED_STATUS_ATTEMPTS = 3
+FAILED_STATUS_RETRY_DELAY = 1.0
+
 
 async def execute_research_worker(job_id: str) -> None:
     """
@@ -129,23 +134,29 @@ async def handle_research_error(job_id: str, error: 'ResearchWorkerError') -> No
         job_id: The job identifier
         error: The research worker error that occurred
     """
-    try:
-        logger.info(f"Handling error for job {job_id}: {error.error_type}")
-        
-        # Update job status to failed with error message
-        success = await appwrite_service.update_job_status(
-            job_id=job_id,
-            status="failed",
-            error_message=error.message
-        )
-        
-        if success:
-            logger.info(f"Job {job_id} status updated to failed")
-        else:
-            logger.error(f"Failed to update job {job_id} error status")
+    logger.info(f"Handling error for job {job_id}: {error.error_type}")
+    
+    for attempt in range(1, FAILED_STATUS_ATTEMPTS + 1):
+        try:
+            # Update job status to failed with error message
+            success = await appwrite_service.update_job_status(
+                job_id=job_id,
+                status="failed",
+                error_message=error.message
+            )
+            
+            if success:
+                logger.info(f"Job {job_id} status updated to failed")
+                return
+            logger.error(f"Failed to update job {job_id} error status (attempt {attempt})")
             
-    except Exception as update_error:
-        logger.error(f"Critical: Failed to update job {job_id} with error status: {str(update_error)}")
+        except Exception as update_error:
+            logger.error(f"Failed to update job {job_id} with error status (attempt {attempt}): {str(update_error)}")
+        
+        if attempt < FAILED_STATUS_ATTEMPTS:
+            await asyncio.sleep(FAILED_STATUS_RETRY_DELAY * 2 ** (attempt - 1))
+    
+    logger.error(f"Critical: Giving up on marking job {job_id} as failed after {FAILED_STATUS_ATTEMPTS} attempts")
 
 
 async def simulate_research_execution(job: Dict[str, Any]) -> 'ResearchWorkerResult':
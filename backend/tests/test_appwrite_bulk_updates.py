@@ -0,0 +1,49 @@
+import httpx
+import orjson
+import pytest
+
+from services.appwrite_service import AppwriteService
+
+
+def make_service(bulk_error_type):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/documents"):
+            return httpx.Response(
+                404,
+                content=orjson.dumps({"message": "not found", "code": 404, "type": bulk_error_type}),
+            )
+        job_id = request.url.path.rsplit("/", 1)[1]
+        return httpx.Response(200, content=orjson.dumps({"$id": job_id, "status": "processing"}))
+
+    client = httpx.AsyncClient(base_url="https://appwrite.test/v1", transport=httpx.MockTransport(handler))
+    return AppwriteService(http_client=client), requests
+
+
+def bulk_requests(requests):
+    return [r for r in requests if r.url.path.endswith("/documents")]
+
+
+@pytest.mark.asyncio
+async def test_missing_route_disables_bulk_updates():
+    service, requests = make_service("general_route_not_found")
+
+    assert await service.update_job_statuses(["a", "b"], "processing") == 2
+    assert await service.update_job_statuses(["c", "d"], "processing") == 2
+
+    assert len(bulk_requests(requests)) == 1
+    assert service._bulk_supported is False
+
+
+@pytest.mark.asyncio
+async def test_other_404_falls_back_for_that_batch_only():
+    service, requests = make_service("collection_not_found")
+
+    assert await service.update_job_statuses(["a", "b"], "processing") == 2
+    assert await service.update_job_statuses(["c", "d"], "processing") == 2
+
+    assert len(bulk_requests(requests)) == 2
+    assert service._bulk_supported is True
+    assert len(requests) == 6
@@ -0,0 +1,31 @@
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from middleware.auth import UserSessionMiddleware
+
+
+async def endpoint(request):
+    return PlainTextResponse("ok")
+
+
+def make_client() -> TestClient:
+    app = Starlette(routes=[Route("/v1/private", endpoint, methods=["GET", "OPTIONS"])])
+    return TestClient(UserSessionMiddleware(app))
+
+
+def test_options_passes_through_without_session():
+    response = make_client().options("/v1/private", headers={"Origin": "https://example.com"})
+    assert response.status_code == 200
+
+
+def test_missing_session_is_rejected():
+    response = make_client().get("/v1/private")
+    assert response.status_code == 401
+
+
+def test_skip_paths_pass_through():
+    app = Starlette(routes=[Route("/health", endpoint)])
+    response = TestClient(UserSessionMiddleware(app)).get("/health")
+    assert response.status_code == 200
@@ -0,0 +1,26 @@
+import pytest
+from cerebras.cloud.sdk import AsyncCerebras
+
+from services.cerebras_service import CerebrasService
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_both_clients():
+    service = CerebrasService(api_key="test-key")
+    async_client = AsyncCerebras(api_key="test-key")
+    service._async_client = async_client
+
+    await service.aclose()
+
+    assert service.client.is_closed()
+    assert async_client.is_closed()
+    assert service._async_client is None
+
+
+@pytest.mark.asyncio
+async def test_aclose_without_async_client():
+    service = CerebrasService(api_key="test-key")
+
+    await service.aclose()
+
+    assert service.client.is_closed()
@@ -0,0 +1,27 @@
+from types import SimpleNamespace
+
+import pytest
+
+from services.exa_service import ExaService
+
+
+@pytest.mark.asyncio
+async def test_repeated_search_is_served_from_cache(monkeypatch):
+    service = ExaService(api_key="test-key")
+    calls = []
+
+    async def search_and_contents(query, **kwargs):
+        calls.append(query)
+        item = SimpleNamespace(title="Example", url="https://example.com", text="Body", score=0.5)
+        return SimpleNamespace(results=[item])
+
+    monkeypatch.setattr(service.client, "search_and_contents", search_and_contents)
+
+    first = await service.search_web("example", num_results=1)
+    first[0]["title"] = "changed"
+    second = await service.search_web("example", num_results=1)
+
+    assert calls == ["example"]
+    assert second == [
+        {"title": "Example", "url": "https://example.com", "content": "Body", "score": 0.5}
+    ]
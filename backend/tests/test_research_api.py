@@ -0,0 +1,77 @@
+import pytest
+from starlette.testclient import TestClient
+
+import main
+import middleware.auth
+from api import research
+from core.auth import AppwriteUser
+
+TOKEN = "header0123456789.payload0123456789.signature0123456789"
+ORIGIN = "http://localhost:3000"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def verify(session_token):
+        return AppwriteUser({"$id": "user-1", "email": "user@example.com"})
+
+    monkeypatch.setattr(middleware.auth, "verify_appwrite_session", verify)
+    return TestClient(main.app, raise_server_exceptions=False)
+
+
+def test_unexpected_error_returns_500_with_cors_headers(client, monkeypatch):
+    async def failing_load(job_id):
+        raise RuntimeError("appwrite exploded")
+
+    monkeypatch.setattr(research.research_job_loader, "load", failing_load)
+
+    response = client.get(
+        "/v1/research/status/job-1",
+        headers={"Authorization": f"Bearer {TOKEN}", "Origin": ORIGIN},
+    )
+
+    assert response.status_code == 500
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert response.json()["error"]["message"] == "Failed to retrieve research status"
+
+
+def test_missing_job_returns_404(client, monkeypatch):
+    async def missing_load(job_id):
+        return None
+
+    monkeypatch.setattr(research.research_job_loader, "load", missing_load)
+
+    response = client.get(
+        "/v1/research/status/job-1",
+        headers={"Authorization": f"Bearer {TOKEN}", "Origin": ORIGIN},
+    )
+
+    assert response.status_code == 404
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+
+
+def test_execute_persists_processing_before_responding(client, monkeypatch):
+    writes = []
+
+    async def pending_load(job_id):
+        return {"$id": job_id, "user_id": "user-1", "status": "pending"}
+
+    async def update_job_status(job_id, status, error_message=None):
+        writes.append((job_id, status))
+        return True
+
+    async def worker(job_id):
+        pass
+
+    monkeypatch.setattr(research.research_job_loader, "load", pending_load)
+    monkeypatch.setattr(research.appwrite_service, "update_job_status", update_job_status)
+    monkeypatch.setattr(research, "execute_research_worker", worker)
+
+    response = client.post(
+        "/v1/research/execute/job-1",
+        headers={"Authorization": f"Bearer {TOKEN}", "Origin": ORIGIN},
+    )
+
+    assert response.status_code == 202
+    assert writes == [("job-1", "processing")]
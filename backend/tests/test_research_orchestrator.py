@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from services.research_orchestrator import (
+    MIN_FEEDBACK_FINDINGS_CHARS,
+    AgentOutputs,
+    ResearchOrchestrator,
+)
+
+
+class FakeExa:
+    def __init__(self):
+        self.queries = []
+
+    async def search_web(self, query, num_results=5):
+        self.queries.append(query)
+        slug = query.replace(" ", "-")
+        return [{"title": query, "url": f"https://example.com/{slug}", "content": "text"}]
+
+    async def search_person(self, name, linkedin_url=None):
+        return [{"title": name, "url": "https://example.com/profile", "content": "text"}]
+
+
+class FakeCerebras:
+    def __init__(self, gaps="NONE"):
+        self.gaps = gaps
+        self.prompts = []
+
+    def ask_ai(self, prompt, max_tokens=600):
+        self.prompts.append(prompt)
+        if prompt.startswith("Based on these additional sources"):
+            return "analysis"
+        if prompt.startswith("Based on this person profile"):
+            return "talking points"
+        return self.gaps
+
+    def ask_ai_long(self, prompt, max_tokens=1500):
+        return "BACKGROUND: a\n\nCURRENT ROLE: b\n\nEXPERTISE: c\n\nRECENT ACTIVITY: d"
+
+
+def make_orchestrator(gaps="NONE"):
+    orchestrator = ResearchOrchestrator.__new__(ResearchOrchestrator)
+    orchestrator.exa = FakeExa()
+    orchestrator.cerebras = FakeCerebras(gaps)
+    orchestrator._llm_semaphore = asyncio.Semaphore(1)
+    return orchestrator
+
+
+def make_outputs():
+    outputs = AgentOutputs()
+    outputs.add("company_discovery", {"analysis": "x" * MIN_FEEDBACK_FINDINGS_CHARS})
+    return outputs
+
+
+@pytest.mark.asyncio
+async def test_prefetched_searches_are_used_with_free_form_follow_ups():
+    orchestrator = make_orchestrator("1. Acme funding rounds in 2024\n2. Acme leadership changes")
+
+    result = await orchestrator._feedback_loop("Acme", make_outputs())
+
+    urls = {source["url"] for source in result["sources"]}
+    assert "https://example.com/Acme-latest-news" in urls
+    assert "https://example.com/Acme-recent-developments" in urls
+    assert "https://example.com/Acme-funding-rounds-in-2024" in urls
+    assert len(orchestrator.exa.queries) == 4
+
+
+@pytest.mark.asyncio
+async def test_matching_follow_up_is_not_searched_twice():
+    orchestrator = make_orchestrator("1. acme latest news\n2. Acme leadership changes")
+
+    result = await orchestrator._feedback_loop("Acme", make_outputs())
+
+    assert orchestrator.exa.queries.count("Acme latest news") == 1
+    assert "acme latest news" not in orchestrator.exa.queries
+    assert len(result["sources"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_prefetched_searches_are_dropped_without_gaps():
+    orchestrator = make_orchestrator("NONE")
+
+    assert await orchestrator._feedback_loop("Acme", make_outputs()) is None
+
+
+@pytest.mark.asyncio
+async def test_talking_points_use_the_full_profile():
+    orchestrator = make_orchestrator()
+
+    result = await orchestrator._person_research_agent("Jane Doe", None)
+
+    talking_points_prompt = orchestrator.cerebras.prompts[-1]
+    assert result["talking_points"] == "talking points"
+    assert result["profile"] in talking_points_prompt
+    assert "RECENT ACTIVITY: d" in talking_points_prompt
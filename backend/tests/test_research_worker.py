@@ -0,0 +1,41 @@
+import pytest
+
+from workers import research_worker
+from workers.research_worker import ResearchWorkerError, handle_research_error
+
+
+class FlakyStatusUpdate:
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = []
+
+    async def __call__(self, job_id, status, error_message=None):
+        self.calls.append((job_id, status, error_message))
+        if len(self.calls) <= self.failures:
+            raise RuntimeError("appwrite unavailable")
+        return True
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(research_worker, "FAILED_STATUS_RETRY_DELAY", 0)
+
+
+@pytest.mark.asyncio
+async def test_failed_status_write_is_retried(monkeypatch):
+    update = FlakyStatusUpdate(failures=2)
+    monkeypatch.setattr(research_worker.appwrite_service, "update_job_status", update)
+
+    await handle_research_error("job-1", ResearchWorkerError("boom", "job-1"))
+
+    assert update.calls == [("job-1", "failed", "boom")] * 3
+
+
+@pytest.mark.asyncio
+async def test_failed_status_write_gives_up_after_max_attempts(monkeypatch):
+    update = FlakyStatusUpdate(failures=10)
+    monkeypatch.setattr(research_worker.appwrite_service, "update_job_status", update)
+
+    await handle_research_error("job-1", ResearchWorkerError("boom", "job-1"))
+
+    assert len(update.calls) == research_worker.FAILED_STATUS_ATTEMPTS
@@ -0,0 +1,29 @@
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from middleware.security import API_CSP, SecurityHeadersMiddleware
+
+
+async def framed(request):
+    return PlainTextResponse(
+        "ok", headers={"X-Frame-Options": "DENY", "Cache-Control": "no-store"}
+    )
+
+
+def make_client() -> TestClient:
+    app = Starlette(routes=[Route("/framed", framed)])
+    return TestClient(SecurityHeadersMiddleware(app))
+
+
+def test_security_headers_replace_existing_values():
+    response = make_client().get("/framed")
+    assert response.headers.get_list("x-frame-options") == ["SAMEORIGIN"]
+    assert response.headers.get_list("content-security-policy") == [API_CSP]
+
+
+def test_other_headers_are_kept():
+    response = make_client().get("/framed")
+    assert response.headers["cache-control"] == "no-store"
+    assert response.headers["x-content-type-options"] == "nosniff"